@@ -435,20 +435,13 @@
                         // Always attempt to play server-provided audio first
                         
                         // Check if this is browser TTS instructions
-                        try {
-                            const decodedData = atob(data.audioData);
-                            const parsedData = JSON.parse(decodedData);
-                            
-                            if (parsedData.type === 'browser-speech') {
-                                // Use Web Speech API for browser TTS
-                                console.log('[Browser TTS] Using Web Speech API for:', parsedData.text);
-                                speakWithBrowserTTS(parsedData.text, parsedData.languageCode, parsedData.autoPlay);
-                            } else {
-                                // Regular audio data - play as before
-                                playAudio(data.audioData, appState.currentAudioFormat);
-                            }
-                        } catch (e) {
-                            // If decoding/parsing fails, treat as regular audio
+                        const speechParams = parseBrowserSpeechPayload(data.audioData);
+                        if (speechParams) {
+                            // Use Web Speech API for browser TTS
+                            console.log('[Browser TTS] Using Web Speech API for:', speechParams.text);
+                            speakWithBrowserTTS(speechParams.text, speechParams.languageCode, speechParams.autoPlay);
+                        } else {
+                            // Regular audio data - play as before
                             playAudio(data.audioData, appState.currentAudioFormat);
                         }
                     }
@@ -819,15 +812,24 @@
         }
     }
 
+    // Decode base64 audio with the browser's native decoder where available (Uint8Array.fromBase64);
+    // older browsers fall back to atob plus a per-byte copy loop.
+    function base64ToBytes(audioBase64) {
+        if (typeof Uint8Array.fromBase64 === 'function') {
+            return Uint8Array.fromBase64(audioBase64);
+        }
+        const binary = atob(audioBase64);
+        const len = binary.length;
+        const bytes = new Uint8Array(len);
+        for (let i = 0; i < len; i++) bytes[i] = binary.charCodeAt(i);
+        return bytes;
+    }
+
     function playAudio(audioBase64, audioFormat = 'mp3') {
         try {
             const mime = audioFormat === 'wav' ? 'audio/wav' : 'audio/mpeg';
             // Prefer Blob URL for better browser compatibility with larger payloads
-            const binary = atob(audioBase64);
-            const len = binary.length;
-            const bytes = new Uint8Array(len);
-            for (let i = 0; i < len; i++) bytes[i] = binary.charCodeAt(i);
-            const blob = new Blob([bytes], { type: mime });
+            const blob = new Blob([base64ToBytes(audioBase64)], { type: mime });
             const url = URL.createObjectURL(blob);
             const audio = new Audio();
             audio.src = url;
@@ -938,22 +940,30 @@
 
     // Removed silent-audio heuristic to prefer server audio playback consistently
 
+    // Browser TTS instructions arrive as base64 of compact JSON.stringify output, which starts with
+    // '{"' ('{"type":...' encodes to 'eyJ0'). Every string starting with '{"' encodes to a leading 'ey',
+    // so the screen accepts those payloads while real audio (e.g. 'SUQz' for MP3, 'UklG' for WAV) is
+    // rejected without decoding. It does not hold for arbitrary JSON: '{\n' encodes to 'ew'.
+    function parseBrowserSpeechPayload(audioBase64) {
+        if (typeof audioBase64 !== 'string' || !audioBase64.startsWith('ey')) return null;
+        try {
+            const parsedData = JSON.parse(atob(audioBase64));
+            return parsedData && parsedData.type === 'browser-speech' ? parsedData : null;
+        } catch (e) {
+            // If decoding/parsing fails, treat as regular audio
+            return null;
+        }
+    }
+
     function playCurrentAudio() {
         if (appState.currentAudioData) {
             // Check if this is browser TTS instructions
-            try {
-                const decodedData = atob(appState.currentAudioData);
-                const parsedData = JSON.parse(decodedData);
-                
-                if (parsedData.type === 'browser-speech') {
-                    // Replay browser TTS
-                    speakWithBrowserTTS(parsedData.text, parsedData.languageCode, true);
-                } else {
-                    // Regular audio data
-                    playAudio(appState.currentAudioData, appState.currentAudioFormat || 'mp3');
-                }
-            } catch (e) {
-                // If decoding/parsing fails, treat as regular audio
+            const speechParams = parseBrowserSpeechPayload(appState.currentAudioData);
+            if (speechParams) {
+                // Replay browser TTS
+                speakWithBrowserTTS(speechParams.text, speechParams.languageCode, true);
+            } else {
+                // Regular audio data
                 playAudio(appState.currentAudioData, appState.currentAudioFormat || 'mp3');
             }
         }
@@ -1035,12 +1035,14 @@ console.log('[DEBUG] teacher.js: Top of file, script is being parsed.');
     function renderRequestCard(payload) {
         if (!domElements.requestsList) return;
         const card = document.createElement('div');
+        card.className = 'request-card';
         card.style.cssText = 'border:1px solid #e5e7eb; border-radius:8px; padding:10px; background:#fff;';
         const name = (payload && payload.name) ? payload.name : 'Student';
         const sid = (payload && payload.studentId) ? ` (${payload.studentId})` : '';
         const lang = (payload && payload.languageCode) ? payload.languageCode : '';
         const text = (payload && payload.text) ? payload.text : '';
         const requestId = payload && payload.requestId;
+        if (requestId) card.dataset.requestId = requestId;
         card.innerHTML = `
             <div style="display:flex; justify-content:space-between; align-items:center; gap:8px;">
                 <div>
@@ -45,18 +45,25 @@ MODELS=(
 
 BASE_URL=${PIPER_MODELS_BASE:-"https://github.com/rhasspy/piper/releases/download/v0.0.2"}
 
-echo "Fetching Piper models into $DEST_DIR"
-for file in "${MODELS[@]}"; do
-  url="$BASE_URL/$file"
-  dest="$DEST_DIR/$file"
+# Parallel downloads (override with PIPER_FETCH_JOBS=1 for sequential)
+JOBS=${PIPER_FETCH_JOBS:-4}
+
+fetch_one() {
+  local file="$1"
+  local url="$BASE_URL/$file"
+  local dest="$DEST_DIR/$file"
   if [[ -f "$dest" ]]; then
     echo "[skip] $file exists"
-    continue
+    return 0
   fi
   echo "[get] $url"
-  curl -fL "$url" -o "$dest"
-done
-
-echo "Done. Models in: $DEST_DIR"
+  # Download to a temp name so an interrupted fetch is never mistaken for a complete model
+  curl -fsSL "$url" -o "$dest.part" && mv "$dest.part" "$dest"
+}
+export -f fetch_one
+export BASE_URL DEST_DIR
 
+echo "Fetching Piper models into $DEST_DIR ($JOBS parallel)"
+printf '%s\n' "${MODELS[@]}" | xargs -P "$JOBS" -I{} bash -c 'fetch_one "$1"' _ {}
 
+echo "Done. Models in: $DEST_DIR"
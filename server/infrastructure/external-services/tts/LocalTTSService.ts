@@ -345,7 +345,7 @@ export class LocalTTSService implements ITTSService {
     const ffmpegModule: any = await import('ffmpeg-static');
     const ffmpegPath: string = ffmpegModule.default || ffmpegModule;
     await new Promise<void>((resolve, reject) => {
-      const child = spawn(ffmpegPath, ['-y', '-hide_banner', '-loglevel', 'error', '-i', aiffPath, '-ac', '1', '-ar', '44100', wavPath], { stdio: ['ignore', 'pipe', 'pipe'] });
+      const child = spawn(ffmpegPath, ['-y', '-hide_banner', '-loglevel', 'error', '-i', aiffPath, '-ac', '1', '-ar', '44100', wavPath], { stdio: ['ignore', 'ignore', 'pipe'] });
       let err = '';
       child.stderr.on('data', (d) => { try { err += d.toString(); } catch {} });
       child.on('error', (e) => reject(e));
@@ -46,12 +46,13 @@ export class AudioFormatConverter {
       const ff = spawn(ffmpegPath as string, args, { stdio: ['pipe', 'pipe', 'pipe'] });
 
       const chunks: Buffer[] = [];
+      let outLength = 0;
       let stderrBuf = '';
-      ff.stdout.on('data', (d) => chunks.push(d));
+      ff.stdout.on('data', (d: Buffer) => { chunks.push(d); outLength += d.length; });
       ff.stderr.on('data', (d) => { try { stderrBuf += d.toString(); } catch {} });
       ff.on('error', reject);
       ff.on('close', (code) => {
-        const out = Buffer.concat(chunks);
+        const out = Buffer.concat(chunks, outLength);
         const okHeader = AudioFormatConverter.hasMpegOrId3Header(out);
         if (code === 0 && okHeader && out.length > 1024) return resolve(out);
         else {
@@ -124,16 +125,23 @@ export class AudioFormatConverter {
       mono = out;
     }
     const mp3Encoder = new lamejs.Mp3Encoder(1, sampleRate, 128);
-    const chunkSize = 1152;
-    const buffers: Int8Array[] = [];
+    // Feed the encoder whole blocks of MP3 frames (1152 samples each): one encodeBuffer call per block
+    // instead of per frame. lamejs encodes into its reused internal mp3buf and copies out only the encoded
+    // bytes either way, so this cuts the number of calls and their fixed per-call overhead, not output bytes
+    const chunkSize = 1152 * 64;
+    // Wrap each encoder output as a Buffer view (no per-frame copy) and concat once with a known length
+    const buffers: Buffer[] = [];
+    let totalLength = 0;
+    const pushFrame = (mp3buf: Int8Array) => {
+      if (mp3buf.length === 0) return;
+      buffers.push(Buffer.from(mp3buf.buffer, mp3buf.byteOffset, mp3buf.byteLength));
+      totalLength += mp3buf.byteLength;
+    };
     for (let i = 0; i < mono.length; i += chunkSize) {
-      const chunk = mono.subarray(i, Math.min(i + chunkSize, mono.length));
-      const mp3buf = mp3Encoder.encodeBuffer(chunk);
-      if (mp3buf.length > 0) buffers.push(mp3buf);
+      pushFrame(mp3Encoder.encodeBuffer(mono.subarray(i, Math.min(i + chunkSize, mono.length))));
     }
-    const end = mp3Encoder.flush();
-    if (end.length > 0) buffers.push(end);
-    return Buffer.concat(buffers.map((b) => Buffer.from(b)));
+    pushFrame(mp3Encoder.flush());
+    return Buffer.concat(buffers, totalLength);
   }
 
   private static hasMpegOrId3Header(buf: Buffer): boolean {
@@ -134,20 +134,20 @@ export class TranslationPipelineService {
   }
 
   async translateAll(originalText: string, sourceLanguage: string, targetLanguages: string[]): Promise<Map<string, string>> {
-    const translations = new Map<string, string>();
-    for (const targetLanguage of targetLanguages) {
+    // Target languages are independent, so translate them concurrently; the Map keeps input order
+    const results = await Promise.all(targetLanguages.map(async (targetLanguage) => {
       try {
         const translated = await this.translationService.translate(originalText, sourceLanguage, targetLanguage);
-        translations.set(targetLanguage, translated);
+        return [targetLanguage, translated] as const;
       } catch (error) {
         logger.error(`Translation failed for ${targetLanguage}:`, {
           error,
           errorMessage: error instanceof Error ? error.message : String(error),
           errorStack: error instanceof Error ? error.stack : undefined
         });
-        translations.set(targetLanguage, originalText);
+        return [targetLanguage, originalText] as const;
       }
-    }
-    return translations;
+    }));
+    return new Map<string, string>(results);
   }
 }
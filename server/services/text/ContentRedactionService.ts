@@ -9,6 +9,15 @@ export class ContentRedactionService {
     'damn', 'hell'
   ];
 
+  // Compiled once; String.prototype.replace resets lastIndex on global regexes, so sharing them is safe
+  private static readonly profanityPattern = new RegExp(
+    `\\b(${ContentRedactionService.profanityList.map(w => ContentRedactionService.escapeRegExp(w)).join('|')})\\b`,
+    'gi'
+  );
+  // Simple email and phone patterns (not exhaustive)
+  private static readonly emailPattern = /[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}/gi;
+  private static readonly phonePattern = /\+?\d[\d\s().-]{6,}\d/g;
+
   static redact(text: string, options: RedactionOptions): string {
     if (!text || (!options.redactProfanity && !options.redactPII)) return text;
     let result = text;
@@ -18,16 +27,12 @@ export class ContentRedactionService {
   }
 
   private static redactProfanity(text: string): string {
-    const pattern = new RegExp(`\\b(${this.profanityList.map(w => this.escapeRegExp(w)).join('|')})\\b`, 'gi');
-    return text.replace(pattern, (m) => '*'.repeat(m.length));
+    return text.replace(this.profanityPattern, (m) => '*'.repeat(m.length));
   }
 
   private static redactPII(text: string): string {
-    // Simple email and phone patterns (not exhaustive)
-    const emailPattern = /[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}/gi;
-    const phonePattern = /\+?\d[\d\s().-]{6,}\d/g;
-    let result = text.replace(emailPattern, '[redacted-email]');
-    result = result.replace(phonePattern, '[redacted-phone]');
+    let result = text.replace(this.emailPattern, '[redacted-email]');
+    result = result.replace(this.phonePattern, '[redacted-phone]');
     return result;
   }
 
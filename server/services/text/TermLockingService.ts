@@ -3,23 +3,48 @@ export interface GlossaryMap {
   [term: string]: { [targetLanguage: string]: string };
 }
 
+interface CompiledGlossary {
+  pattern: RegExp;
+  // lowercased term -> locked term (replacement lookup only; the pattern uses the original spellings)
+  lockedByTerm: Map<string, string>;
+}
+
 export class TermLockingService {
+  // One combined matcher per target language, built on first use
+  private readonly compiled = new Map<string, CompiledGlossary | null>();
+
   constructor(private readonly glossary: GlossaryMap = {}) {}
 
   applyLockedTerms(translatedText: string, targetLanguage: string): string {
     if (!translatedText) return translatedText;
-    let output = translatedText;
+    const compiled = this.getCompiled(targetLanguage);
+    if (!compiled) return translatedText;
+    // Single pass over the text for all terms instead of one regex scan per glossary entry
+    return translatedText.replace(compiled.pattern, (match) => compiled.lockedByTerm.get(match.toLowerCase()) ?? match);
+  }
+
+  private getCompiled(targetLanguage: string): CompiledGlossary | null {
+    if (this.compiled.has(targetLanguage)) return this.compiled.get(targetLanguage)!;
+    const lockedByTerm = new Map<string, string>();
+    const terms: string[] = [];
     for (const term of Object.keys(this.glossary)) {
       const locked = this.glossary[term]?.[targetLanguage];
       if (!locked) continue;
-      // Word boundary regex; supports multi‑word
-      const escaped = term.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
-      const pattern = new RegExp(`\\b${escaped}\\b`, 'gi');
-      output = output.replace(pattern, locked);
+      // Match on the glossary spelling: lowercasing can change the string (e.g. 'İ' -> 'i̇'), which /i would not match
+      terms.push(term);
+      const key = term.toLowerCase();
+      if (!lockedByTerm.has(key)) lockedByTerm.set(key, locked);
     }
-    return output;
+    let compiled: CompiledGlossary | null = null;
+    if (terms.length > 0) {
+      // Longest terms first so multi‑word entries win over terms they contain; word boundaries as before
+      const alternation = terms
+        .sort((a, b) => b.length - a.length)
+        .map((term) => term.replace(/[.*+?^${}()|[\]\\]/g, '\\$&'))
+        .join('|');
+      compiled = { pattern: new RegExp(`\\b(?:${alternation})\\b`, 'gi'), lockedByTerm };
+    }
+    this.compiled.set(targetLanguage, compiled);
+    return compiled;
   }
 }
-
-
-
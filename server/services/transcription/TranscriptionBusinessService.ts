@@ -14,6 +14,7 @@ import type { SpeechPipelineOrchestrator } from '../../application/services/Spee
 import { FeatureFlags } from '../../application/services/config/FeatureFlags';
 import { ACEOrchestrator } from '../../application/services/ace/ACEOrchestrator';
 import type { WebSocketClient } from '../../interface-adapters/websocket/websocket-services/ConnectionManager';
+import type { ITTSService } from '../tts/TTSService';
 
 export interface TranscriptionProcessingRequest {
   text: string;
@@ -40,6 +41,9 @@ export interface ClientSettingsProvider {
 }
 
 export class TranscriptionBusinessService {
+  // German original-audio TTS client, created on first use and reused for every later transcription
+  private kartoffelTTS?: Promise<ITTSService>;
+
   constructor(
     private storage: IStorage,
     private speechPipelineOrchestrator: SpeechPipelineOrchestrator
@@ -123,10 +127,11 @@ export class TranscriptionBusinessService {
 
     // Group students by their target language
     const studentsByLanguage = new Map<string, WebSocketClient[]>();
+    const requestedLanguages = new Set(studentLanguages);
     
     for (const student of studentConnections) {
       const targetLang = clientProvider.getLanguage(student);
-      if (targetLang && studentLanguages.includes(targetLang)) {
+      if (targetLang && requestedLanguages.has(targetLang)) {
         if (!studentsByLanguage.has(targetLang)) {
           studentsByLanguage.set(targetLang, []);
         }
@@ -134,48 +139,12 @@ export class TranscriptionBusinessService {
       }
     }
 
-    // Optional: synthesize original-source audio once (teacherLanguage) only when explicitly enabled to avoid espeak aborts in tests
+    // Optional: synthesize original-source audio once (teacherLanguage) only when explicitly enabled to avoid espeak aborts in tests.
+    // Started without awaiting so it overlaps the per-language translation and TTS below; each group awaits it just before delivery.
     const includeOriginalAudio = (process.env.FEATURE_INCLUDE_ORIGINAL_TTS || '0') === '1';
-    let originalAudioBase64: string | null = null;
-    let originalAudioFormat: 'mp3' | 'wav' | undefined;
-    let originalTtsServiceType: string | undefined;
-    if (includeOriginalAudio) {
-      try {
-        const isGerman = /^de(-|_|$)/i.test(teacherLanguage) || teacherLanguage.toLowerCase() === 'de';
-        if (isGerman) {
-          // Prefer Kartoffel for German; fallback to default pipeline on failure/empty
-          try {
-            const { KartoffelTTSService } = await import('../../infrastructure/external-services/tts/KartoffelTTSService');
-            const svc = new KartoffelTTSService();
-            const res = await svc.synthesize(text, { language: teacherLanguage });
-            if (res && res.audioBuffer && res.audioBuffer.length > 0) {
-              originalAudioBase64 = res.audioBuffer.toString('base64');
-              originalTtsServiceType = res.ttsServiceType || 'kartoffel';
-              originalAudioFormat = originalTtsServiceType === 'local' ? 'wav' : 'mp3';
-            }
-          } catch (_) {
-            // ignore and fallback below
-          }
-          if (!originalAudioBase64) {
-            const fallback = await this.speechPipelineOrchestrator.synthesizeSpeech(text, teacherLanguage);
-            if (fallback && fallback.audioBuffer && fallback.audioBuffer.length > 0) {
-              originalAudioBase64 = fallback.audioBuffer.toString('base64');
-              originalTtsServiceType = fallback.ttsServiceType;
-              originalAudioFormat = fallback.ttsServiceType === 'local' ? 'wav' : 'mp3';
-            }
-          }
-        } else {
-          const originalTTS = await this.speechPipelineOrchestrator.synthesizeSpeech(text, teacherLanguage);
-          if (originalTTS && originalTTS.audioBuffer && originalTTS.audioBuffer.length > 0) {
-            originalAudioBase64 = originalTTS.audioBuffer.toString('base64');
-            originalTtsServiceType = originalTTS.ttsServiceType;
-            originalAudioFormat = originalTTS.ttsServiceType === 'local' ? 'wav' : 'mp3';
-          }
-        }
-      } catch (e) {
-        originalAudioBase64 = null;
-      }
-    }
+    const originalAudioPromise = includeOriginalAudio
+      ? this.synthesizeOriginalAudio(text, teacherLanguage)
+      : Promise.resolve(null);
 
     // Prepare ACE orchestrator if enabled
     const aceEnabled = FeatureFlags.ACE;
@@ -196,14 +165,14 @@ export class TranscriptionBusinessService {
 
           // Apply ACE shaping per-student (term-locking, simplification)
           // Note: term-locking applied within ACE orchestrator; per-student lowLiteracyMode respected
-          const shapedByStudent: Array<{ ws: WebSocketClient; text: string }> = [];
+          const shapedByStudent = new Map<WebSocketClient, string>();
           for (const student of students) {
             const settings = options.clientProvider.getClientSettings(student) || {};
             const low = !!settings.lowLiteracyMode;
             const aceToggle = !!settings.aceEnabled;
             const useACE = FeatureFlags.ACE || aceToggle;
             const textForStudent = useACE && ace ? ace.applyPerStudentShaping(translation, { lowLiteracyMode: low, languageCode: targetLanguage }) : translation;
-            shapedByStudent.push({ ws: student, text: textForStudent });
+            shapedByStudent.set(student, textForStudent);
           }
 
           // Generate TTS audio for the language group only when not using client speech
@@ -213,10 +182,12 @@ export class TranscriptionBusinessService {
             targetLanguage
           );
 
+          const originalAudio = await originalAudioPromise;
+
           // Send translation and audio to students in this language group
           for (const student of students) {
             try {
-              const shaped = shapedByStudent.find(s => s.ws === student)?.text || translation;
+              const shaped = shapedByStudent.get(student) || translation;
 
               // Determine per-student audio delivery: for low-literacy, instruct browser TTS; otherwise send server audio
               const studentSettings = options.clientProvider.getClientSettings(student) || {};
@@ -244,17 +215,17 @@ export class TranscriptionBusinessService {
                 audioData: audioDataBase64,
                 audioFormat: audioFormat,
                 // Feature: include original-source audio in teacher's language when enabled
-                ...(originalAudioBase64 ? {
-                  originalAudioData: originalAudioBase64,
-                  originalAudioFormat: originalAudioFormat || 'mp3'
+                ...(originalAudio ? {
+                  originalAudioData: originalAudio.base64,
+                  originalAudioFormat: originalAudio.format || 'mp3'
                 } : {}),
                 sourceLanguage: teacherLanguage,
                 targetLanguage: targetLanguage,
                 timestamp: Date.now(),
                 ttsServiceType: ttsResult.ttsServiceType // Add the missing TTS service type
               };
-              if (originalAudioBase64 && originalTtsServiceType) {
-                try { (message as any).originalTtsServiceType = originalTtsServiceType; } catch {}
+              if (originalAudio && originalAudio.ttsServiceType) {
+                try { (message as any).originalTtsServiceType = originalAudio.ttsServiceType; } catch {}
               }
 
               // Send the message via WebSocket
@@ -336,6 +307,60 @@ export class TranscriptionBusinessService {
     logger.info(`Completed translation processing for ${studentsByLanguage.size} languages`);
   }
 
+  /**
+   * Synthesize the original-source audio in the teacher's language.
+   * German prefers Kartoffel and falls back to the default pipeline on failure/empty.
+   * Never rejects: any failure yields null so delivery proceeds without original audio.
+   */
+  private async synthesizeOriginalAudio(
+    text: string,
+    teacherLanguage: string
+  ): Promise<{ base64: string; format: 'mp3' | 'wav'; ttsServiceType?: string } | null> {
+    try {
+      const isGerman = /^de(-|_|$)/i.test(teacherLanguage) || teacherLanguage.toLowerCase() === 'de';
+      if (isGerman) {
+        try {
+          const svc = await this.getKartoffelTTS();
+          const res = await svc.synthesize(text, { language: teacherLanguage });
+          if (res && res.audioBuffer && res.audioBuffer.length > 0) {
+            const ttsServiceType = res.ttsServiceType || 'kartoffel';
+            return {
+              base64: res.audioBuffer.toString('base64'),
+              format: ttsServiceType === 'local' ? 'wav' : 'mp3',
+              ttsServiceType
+            };
+          }
+        } catch (_) {
+          // ignore and fallback below
+        }
+      }
+      const tts = await this.speechPipelineOrchestrator.synthesizeSpeech(text, teacherLanguage);
+      if (tts && tts.audioBuffer && tts.audioBuffer.length > 0) {
+        return {
+          base64: tts.audioBuffer.toString('base64'),
+          format: tts.ttsServiceType === 'local' ? 'wav' : 'mp3',
+          ttsServiceType: tts.ttsServiceType
+        };
+      }
+      return null;
+    } catch (e) {
+      return null;
+    }
+  }
+
+  /**
+   * Lazily load the Kartoffel TTS client once per service instance
+   */
+  private getKartoffelTTS(): Promise<ITTSService> {
+    if (!this.kartoffelTTS) {
+      this.kartoffelTTS = import('../../infrastructure/external-services/tts/KartoffelTTSService')
+        .then(({ KartoffelTTSService }) => new KartoffelTTSService());
+      // Don't cache a failed import; the next transcription retries it
+      this.kartoffelTTS.catch(() => { this.kartoffelTTS = undefined; });
+    }
+    return this.kartoffelTTS;
+  }
+
   /**
    * Validate if transcription should be processed
    */
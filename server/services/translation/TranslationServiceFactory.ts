@@ -14,6 +14,47 @@ import { OpenAI } from 'openai';
 import { ITranslationService, OpenAITranslationService } from '../TranslationService.js';
 import { MyMemoryTranslationService } from './MyMemoryTranslationService.js';
 
+// HTTP status codes that should trigger fallback (built once at module load, not per failure check)
+const FALLBACK_STATUS_CODES = new Set<number>([
+  429, // Too Many Requests (rate limit)
+  402, // Payment Required (billing issue)
+  401, // Unauthorized (invalid API key)
+  403, // Forbidden (quota exceeded, model access denied)
+  500, // Internal Server Error
+  502, // Bad Gateway  
+  503, // Service Unavailable
+  504, // Gateway Timeout
+  400  // Bad Request (sometimes quota related)
+]);
+
+// Error message patterns that should trigger fallback (lowercase; matched against the lowercased message)
+const FALLBACK_ERROR_PATTERNS: readonly string[] = [
+  // Rate limiting
+  'rate limit', 'too many requests', 'rate exceeded',
+  
+  // Quota and billing
+  'quota', 'insufficient_quota', 'quota exceeded', 'billing',
+  'exceeded', 'insufficient funds', 'payment required',
+  'usage limit', 'monthly limit',
+  
+  // API key issues
+  'invalid api key', 'authentication', 'unauthorized', 'api key',
+  'invalid_api_key', 'incorrect api key',
+  
+  // Service issues
+  'service unavailable', 'server error', 'internal error',
+  'timeout', 'connection', 'network', 'bad gateway',
+  'service overloaded', 'temporarily unavailable',
+  
+  // Model access issues
+  'model not found', 'access denied', 'forbidden',
+  'model unavailable', 'model overloaded', 'model not available',
+  
+  // General API issues
+  'openai api', 'api error', 'request failed', 'failed to fetch',
+  'network error', 'connection refused', 'connection timeout'
+];
+
 /**
  * Comprehensive Auto-Fallback Translation Service
  * Automatically falls back to MyMemory when OpenAI fails for any reason
@@ -56,56 +97,14 @@ export class AutoFallbackTranslationService implements ITranslationService {
     const errorMessage = error.message?.toLowerCase() || '';
     const errorCode = error.status || error.code;
     
-    // HTTP status codes that should trigger fallback
-    const fallbackStatusCodes = [
-      429, // Too Many Requests (rate limit)
-      402, // Payment Required (billing issue)
-      401, // Unauthorized (invalid API key)
-      403, // Forbidden (quota exceeded, model access denied)
-      500, // Internal Server Error
-      502, // Bad Gateway  
-      503, // Service Unavailable
-      504, // Gateway Timeout
-      400  // Bad Request (sometimes quota related)
-    ];
-    
     // Check status codes
-    if (fallbackStatusCodes.includes(errorCode)) {
+    if (FALLBACK_STATUS_CODES.has(errorCode)) {
       console.log(`[AutoFallback Translation] OpenAI API error detected - Status Code: ${errorCode}`);
       return true;
     }
     
     // Check error message patterns (case-insensitive)
-    const fallbackErrorPatterns = [
-      // Rate limiting
-      'rate limit', 'too many requests', 'rate exceeded',
-      
-      // Quota and billing
-      'quota', 'insufficient_quota', 'quota exceeded', 'billing',
-      'exceeded', 'insufficient funds', 'payment required',
-      'usage limit', 'monthly limit',
-      
-      // API key issues
-      'invalid api key', 'authentication', 'unauthorized', 'api key',
-      'invalid_api_key', 'incorrect api key',
-      
-      // Service issues
-      'service unavailable', 'server error', 'internal error',
-      'timeout', 'connection', 'network', 'bad gateway',
-      'service overloaded', 'temporarily unavailable',
-      
-      // Model access issues
-      'model not found', 'access denied', 'forbidden',
-      'model unavailable', 'model overloaded', 'model not available',
-      
-      // General API issues
-      'openai api', 'api error', 'request failed', 'failed to fetch',
-      'network error', 'connection refused', 'connection timeout'
-    ];
-    
-    const matchedPattern = fallbackErrorPatterns.find(pattern => 
-      errorMessage.includes(pattern.toLowerCase())
-    );
+    const matchedPattern = FALLBACK_ERROR_PATTERNS.find(pattern => errorMessage.includes(pattern));
     
     if (matchedPattern) {
       console.log(`[AutoFallback Translation] OpenAI API error detected - Pattern: "${matchedPattern}"`);
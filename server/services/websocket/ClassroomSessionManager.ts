@@ -4,6 +4,7 @@
  * Manages classroom codes, session validation, and cleanup.
  * Handles the generation and lifecycle of classroom sessions.
  */
+import { randomFillSync } from 'crypto';
 import logger from '../../logger';
 import { config } from '../../config';
 
@@ -16,6 +17,26 @@ export interface ClassroomSession {
   expiresAt: number;
 }
 
+const CLASSROOM_CODE_CHARS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789';
+const CLASSROOM_CODE_LENGTH = 6;
+// Largest multiple of the alphabet size that fits in a byte; higher bytes are rejected to avoid modulo bias
+const UNBIASED_BYTE_LIMIT = 256 - (256 % CLASSROOM_CODE_CHARS.length);
+
+/**
+ * Generate a random 6-character classroom code from one native random fill
+ */
+export function randomClassroomCode(): string {
+  const bytes = new Uint8Array(CLASSROOM_CODE_LENGTH * 2);
+  let code = '';
+  while (code.length < CLASSROOM_CODE_LENGTH) {
+    randomFillSync(bytes);
+    for (let i = 0; i < bytes.length && code.length < CLASSROOM_CODE_LENGTH; i++) {
+      if (bytes[i] < UNBIASED_BYTE_LIMIT) code += CLASSROOM_CODE_CHARS[bytes[i] % CLASSROOM_CODE_CHARS.length];
+    }
+  }
+  return code;
+}
+
 export class ClassroomSessionManager {
   private classroomSessions: Map<string, ClassroomSession> = new Map();
   private cleanupInterval: NodeJS.Timeout | null = null;
@@ -43,16 +64,10 @@ export class ClassroomSessionManager {
     
     console.log(`🔍 DEBUG: No existing code found for sessionId ${sessionId}, generating new one`);
     
-    // Generate new 6-character code
-    const chars = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789';
+    // Generate new 6-character code, ensuring uniqueness
     let code: string;
-    
-    // Ensure uniqueness
     do {
-      code = '';
-      for (let i = 0; i < 6; i++) {
-        code += chars.charAt(Math.floor(Math.random() * chars.length));
-      }
+      code = randomClassroomCode();
     } while (this.classroomSessions.has(code));
     
     console.log(`🔍 DEBUG: Generated new classroom code: ${code} for sessionId: ${sessionId}`);
@@ -9,6 +9,7 @@ import logger from '../../logger';
 import { config } from '../../config';
 import { IStorage } from '../../storage.interface';
 import type { InsertSession } from '../../../shared/schema';
+import { randomClassroomCode } from './ClassroomSessionManager';
 
 // Classroom session interface
 export interface ClassroomSession {
@@ -51,11 +52,7 @@ export class SessionService {
     }
 
     // Generate new 6-character alphanumeric code
-    const characters = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789';
-    let result = '';
-    for (let i = 0; i < 6; i++) {
-      result += characters.charAt(Math.floor(Math.random() * characters.length));
-    }
+    const result = randomClassroomCode();
 
     // Create new classroom session
     const session: ClassroomSession = {
@@ -50,6 +50,9 @@ export class MemSessionStorage implements ISessionStorage {
   private readonly sessions: Map<number, Session>;
   private idCounter: { value: number };
   private readonly transcripts: Map<number, Transcript>;
+  // sessionId -> numeric map key. The sessions map is shared with other storages, so every hit is
+  // re-checked against the map and a miss falls back to a scan that refreshes the entry.
+  private readonly idBySessionId = new Map<string, number>();
 
   constructor(sessions: Map<number, Session>, idCounter: { value: number }, transcripts: Map<number, Transcript>) {
     this.sessions = sessions;
@@ -71,6 +74,22 @@ export class MemSessionStorage implements ISessionStorage {
     // Add other validation rules as needed
   }
 
+  private findBySessionId(sessionId: string): Session | undefined {
+    const id = this.idBySessionId.get(sessionId);
+    if (id !== undefined) {
+      const cached = this.sessions.get(id);
+      if (cached && cached.sessionId === sessionId) return cached;
+      this.idBySessionId.delete(sessionId);
+    }
+    for (const session of this.sessions.values()) {
+      if (session.sessionId === sessionId) {
+        this.idBySessionId.set(sessionId, session.id);
+        return session;
+      }
+    }
+    return undefined;
+  }
+
   async createSession(insertSession: InsertSession): Promise<Session> {
     this.validateSessionInput(insertSession);
     const id = this.idCounter.value++;
@@ -96,7 +115,7 @@ export class MemSessionStorage implements ISessionStorage {
   }
 
   async updateSession(sessionId: string, updates: Partial<InsertSession>): Promise<Session | undefined> {
-    const session = Array.from(this.sessions.values()).find(s => s.sessionId === sessionId);
+    const session = this.findBySessionId(sessionId);
     if (!session) {
       return undefined;
     }
@@ -106,7 +125,8 @@ export class MemSessionStorage implements ISessionStorage {
   }
 
   async getActiveSession(sessionId: string): Promise<Session | undefined> {
-    return Array.from(this.sessions.values()).find(s => s.sessionId === sessionId && s.isActive);
+    const session = this.findBySessionId(sessionId);
+    return session?.isActive ? session : undefined;
   }
 
   async getAllActiveSessions(): Promise<Session[]> {
@@ -181,7 +201,7 @@ export class MemSessionStorage implements ISessionStorage {
   }
 
   async getSessionById(sessionId: string): Promise<Session | undefined> {
-    return Array.from(this.sessions.values()).find(s => s.sessionId === sessionId);
+    return this.findBySessionId(sessionId);
   }
 
   async getTranscriptCountBySession(sessionId: string): Promise<number> {
@@ -249,7 +269,7 @@ export class MemSessionStorage implements ISessionStorage {
   }
 
   async reactivateSession(sessionId: string): Promise<Session | null> {
-    const session = Array.from(this.sessions.values()).find(s => s.sessionId === sessionId);
+    const session = this.findBySessionId(sessionId);
     if (!session) {
       return null;
     }
@@ -217,6 +217,9 @@ export function serveStatic(app: express.Express): void {
     return;
   }
   
+  // Vite emits content-hashed filenames under assets/, so browsers can keep them without revalidating.
+  // Everything else (unhashed public files like /js/student.js) keeps the default ETag/Last-Modified revalidation.
+  app.use('/assets', express.static(path.join(clientDistPath, 'assets'), { index: false, immutable: true, maxAge: '1y' }));
   app.use(express.static(clientDistPath, { index: false })); 
 
   const htmlEntries: { [key: string]: string } = {
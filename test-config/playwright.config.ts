@@ -31,12 +31,27 @@ export default defineConfig({
   forbidOnly: !!process.env.CI,
   retries: process.env.CI ? 2 : 0,
   workers: 1, // Force single worker to ensure database isolation
-  reporter: process.env.CI ? "dot" : "html",
+  // On CI also emit JUnit XML: results stream per test and CI dashboards consume the file directly
+  reporter: process.env.CI ? [["dot"], ["junit", { outputFile: "test-results/e2e-junit.xml" }]] : "html",
   globalSetup: "./global-setup.ts",
   use: {
     baseURL: process.env.PLAYWRIGHT_BASE_URL || `http://${process.env.HOST || "127.0.0.1"}:${process.env.PORT || "5001"}`,
     trace: "on-first-retry",
-    headless: true,
+    // Capture a screenshot only when a test fails; passing tests never pay for encoding/writing PNGs
+    screenshot: "only-on-failure",
+    // HEADED=1 opens a visible browser for local debugging; everything else runs headless
+    headless: process.env.HEADED !== "1",
+    launchOptions: {
+      // Chromium background work the tests never observe
+      args: [
+        "--disable-extensions",
+        "--disable-background-networking",
+        "--disable-sync",
+        "--disable-translate",
+        "--metrics-recording-only",
+        "--mute-audio",
+      ],
+    },
     ...(process.env.ANALYTICS_PASSWORD
       ? {
           httpCredentials: {
@@ -96,6 +96,9 @@ export default defineConfig({
     maxThreads: testMode === 'integration' ? 1 : (testMode === 'component' ? 1 : 2),
     minThreads: testMode === 'integration' ? 1 : (testMode === 'component' ? 1 : 1),
     silent: false,
+    // On CI also write JUnit XML next to the coverage report (the workflow uploads ./coverage as the test-results artifact)
+    reporters: process.env.CI ? ['default', 'junit'] : ['default'],
+    outputFile: process.env.CI ? { junit: `./coverage/junit-${testMode}.xml` } : undefined,
     isolate: true,
     // Use threads with single thread for integration and component tests
     pool: 'threads',
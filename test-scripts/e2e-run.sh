@@ -6,12 +6,42 @@ PORT=5001
 # Kill any existing process on the test port
 lsof -ti:$PORT | xargs kill -9 2>/dev/null
 
-# Start backend server in background
-npm run dev:test &
+# Stop the whole server process group (npm -> sh -> tsx -> node), not just the npm wrapper.
+# SIGTERM first, wait up to 5s, then SIGKILL, then clear anything still bound to the port.
+stop_server() {
+  [ -n "$SERVER_PID" ] || return 0
+  kill -TERM -- -"$SERVER_PID" 2>/dev/null
+  for _ in $(seq 1 50); do
+    kill -0 -- -"$SERVER_PID" 2>/dev/null || break
+    sleep 0.1
+  done
+  kill -KILL -- -"$SERVER_PID" 2>/dev/null
+  wait "$SERVER_PID" 2>/dev/null
+  lsof -ti:$PORT | xargs kill -9 2>/dev/null
+  SERVER_PID=
+}
+trap stop_server EXIT
+trap 'exit 130' INT TERM
+
+# Start backend server in background, in its own process group (job control) so it can be stopped as a unit
+set -m
+npm run dev:test < /dev/null &
 SERVER_PID=$!
+set +m
 
-# Wait for server to be ready (adjust as needed)
-sleep 10
+# Wait for the health endpoint instead of a fixed sleep, for at most 60s of wall-clock time
+# (the deadline also covers time spent inside curl); bail out early if the server dies
+READY=0
+DEADLINE=$((SECONDS + 60))
+while [ "$SECONDS" -lt "$DEADLINE" ]; do
+  if curl -fs -o /dev/null --max-time 1 "http://127.0.0.1:$PORT/api/health"; then
+    READY=1
+    break
+  fi
+  kill -0 $SERVER_PID 2>/dev/null || { echo "Test server exited before becoming ready"; exit 1; }
+  sleep 0.25
+done
+[ "$READY" = 1 ] || { echo "Test server not ready"; exit 1; }
 
 # Run Cypress E2E tests (all or specific spec)
 if [ -n "$1" ]; then
@@ -22,7 +52,5 @@ else
   TEST_EXIT_CODE=$?
 fi
 
-# Kill backend server
-kill $SERVER_PID
-
+# Backend server is stopped by the EXIT trap
 exit $TEST_EXIT_CODE
@@ -303,8 +303,9 @@ describe('Clean Architecture Boundary Tests', () => {
         'WebSocketResponseService.ts'
       ];
       
-      const websocketFiles = fs.readdirSync(websocketDir)
-        .filter(file => file.endsWith('.ts') && !file.endsWith('.old'));
+      const websocketFiles = fs.readdirSync(websocketDir, { withFileTypes: true })
+        .filter(entry => entry.isFile() && entry.name.endsWith('.ts'))
+        .map(entry => entry.name);
       
       websocketFiles.forEach(file => {
         const isTransportRelated = allowedWebSocketHandlers.includes(file);
@@ -325,9 +326,9 @@ describe('Clean Architecture Boundary Tests', () => {
       return [];
     }
     
-    return fs.readdirSync(websocketDir)
-      .filter(file => file.endsWith('Handler.ts'))
-      .map(file => path.join(websocketDir, file))
-      .filter(fs.existsSync);
+    // withFileTypes gives file-vs-directory from the directory read itself, so no per-entry stat is needed
+    return fs.readdirSync(websocketDir, { withFileTypes: true })
+      .filter(entry => entry.isFile() && entry.name.endsWith('Handler.ts'))
+      .map(entry => path.join(websocketDir, entry.name));
   }
 });
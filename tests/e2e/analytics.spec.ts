@@ -1,7 +1,8 @@
 // @ts-check
-import { test, expect } from '@playwright/test';
+import { test, expect, type Page } from '@playwright/test';
 import { getAnalyticsURL } from './helpers/test-config';
 import { testConfig } from './helpers/test-timeouts';
+import { expectAllVisible } from './helpers/page-helpers';
 import { seedRealisticTestData, clearDiagnosticData } from './test-data-utils';
 
 /**
@@ -15,6 +16,18 @@ import { seedRealisticTestData, clearDiagnosticData } from './test-data-utils';
  * - Quick stats display
  */
 
+// Submit a question (click or Enter) and wait for the /api/analytics/ask round trip itself instead of a fixed sleep.
+// The listener is registered before submitting so a fast response can't be missed.
+async function submitAndWaitForAnswer(page: Page, submit: () => Promise<unknown>): Promise<void> {
+  await Promise.all([
+    page.waitForResponse(
+      (resp) => resp.url().endsWith('/api/analytics/ask'),
+      { timeout: Math.max(testConfig.ui.connectionStatusTimeout, 10000) }
+    ),
+    submit(),
+  ]);
+}
+
 test.describe('Analytics Page', () => {
   test.beforeEach(async ({ page }) => {
     await clearDiagnosticData();
@@ -39,22 +52,21 @@ test.describe('Analytics Page', () => {
     await expect(page.locator('h1')).toContainText('AI Voice Translator Analytics');
     
     // Wait for the Analytics Assistant section to be visible
-    await page.waitForSelector('h3:has-text("Analytics Assistant")', { timeout: testConfig.ui.elementVisibilityTimeout });
+    await page.waitForSelector('#chatContainer .welcome-message h3', { timeout: testConfig.ui.elementVisibilityTimeout });
     await expect(page.getByRole('heading', { name: '🤖 Analytics Assistant' })).toBeVisible();
     
-    // Check for input elements
-    await expect(page.locator('#questionInput')).toBeVisible();
-    await expect(page.locator('#askButton')).toBeVisible();
-    
-    // Check for sidebar elements
-    await expect(page.locator('.quick-stats')).toBeVisible();
-    await expect(page.locator('.suggestion-buttons')).toBeVisible();
-    
-    // Verify quick stats elements exist (don't check values since they might be loading)
-    await expect(page.locator('#totalSessions')).toBeVisible();
-    await expect(page.locator('#todaySessions')).toBeVisible();
-    await expect(page.locator('#totalStudents')).toBeVisible();
-    await expect(page.locator('#avgDuration')).toBeVisible();
+    // Check input elements, sidebar elements and quick stats in one browser-side poll
+    // (don't check quick stats values since they might be loading)
+    await expectAllVisible(page, [
+      '#questionInput',
+      '#askButton',
+      '.quick-stats',
+      '.suggestion-buttons',
+      '#totalSessions',
+      '#todaySessions',
+      '#totalStudents',
+      '#avgDuration',
+    ]);
   });
 
   test('should handle natural language queries', async ({ page }) => {
@@ -62,10 +74,7 @@ test.describe('Analytics Page', () => {
     
     // Test a simple query
     await page.fill('#questionInput', 'How many total sessions are there?');
-    await page.click('#askButton');
-    
-    // Wait for response
-    await page.waitForTimeout(2000);
+    await submitAndWaitForAnswer(page, () => page.click('#askButton'));
     
     // Check that a response was added to the chat
     const messages = page.locator('.ai-message');
@@ -81,17 +90,14 @@ test.describe('Analytics Page', () => {
     await page.goto(getAnalyticsURL());
     
     // Click on a suggestion button
-    await page.click('.suggestion-btn:has-text("👥 Avg Students")');
+    await page.locator('.suggestion-buttons .suggestion-btn', { hasText: '👥 Avg Students' }).click();
     
     // Verify the input was filled
     const inputValue = await page.locator('#questionInput').inputValue();
     expect(inputValue).toContain('average number of students');
     
     // Submit the query
-    await page.click('#askButton');
-    
-    // Wait for response
-    await page.waitForTimeout(2000);
+    await submitAndWaitForAnswer(page, () => page.click('#askButton'));
     
     // Check that a response was generated
     const messages = page.locator('.ai-message');
@@ -103,10 +109,7 @@ test.describe('Analytics Page', () => {
     
     // Ask for a chart
     await page.fill('#questionInput', 'Show me a chart of sessions per day this week');
-    await page.click('#askButton');
-    
-    // Wait for response and potential chart generation
-    await page.waitForTimeout(3000);
+    await submitAndWaitForAnswer(page, () => page.click('#askButton'));
     
     // Check for AI response
     const messages = page.locator('.ai-message');
@@ -127,10 +130,7 @@ test.describe('Analytics Page', () => {
     
     // Query for session lifecycle information
     await page.fill('#questionInput', 'Tell me about session status and lifecycle information');
-    await page.click('#askButton');
-    
-    // Wait for response
-    await page.waitForTimeout(2000);
+    await submitAndWaitForAnswer(page, () => page.click('#askButton'));
     
     // Verify response contains session information
     const response = await page.locator('.ai-message').first().textContent();
@@ -138,9 +138,7 @@ test.describe('Analytics Page', () => {
     
     // Test another lifecycle-related query
     await page.fill('#questionInput', 'How many active sessions are there?');
-    await page.click('#askButton');
-    
-    await page.waitForTimeout(2000);
+    await submitAndWaitForAnswer(page, () => page.click('#askButton'));
     
     // Should have 2 AI responses now
     const messages = page.locator('.ai-message');
@@ -206,11 +204,8 @@ test.describe('Analytics Page', () => {
       console.log('⚠️  Loading state test skipped due to timing issues');
     }
     
-    // Wait for completion (button should be enabled again)
-    await page.waitForTimeout(2000);
-    
-    // Button should be enabled again after completion
-    await expect(button).toBeEnabled({ timeout: 1000 });
+    // Button should be enabled again once the query completes
+    await expect(button).toBeEnabled({ timeout: Math.max(testConfig.ui.connectionStatusTimeout, 10000) });
     
     // Check that some response was generated (even if it's an error response)
     const chatContainer = page.locator('#chatContainer');
@@ -223,10 +218,7 @@ test.describe('Analytics Page', () => {
     
     // Type a query and press Enter
     await page.fill('#questionInput', 'What is the total number of translations?');
-    await page.press('#questionInput', 'Enter');
-    
-    // Wait for response
-    await page.waitForTimeout(2000);
+    await submitAndWaitForAnswer(page, () => page.press('#questionInput', 'Enter'));
     
     // Check that a response was generated
     const messages = page.locator('.ai-message');
@@ -246,10 +238,7 @@ test.describe('Analytics Page', () => {
     
     for (let i = 0; i < queries.length; i++) {
       await page.fill('#questionInput', queries[i]);
-      await page.click('#askButton');
-      
-      // Wait for each response
-      await page.waitForTimeout(2000);
+      await submitAndWaitForAnswer(page, () => page.click('#askButton'));
       
       // Verify we have the expected number of responses
       const messages = page.locator('.ai-message');
@@ -262,9 +251,7 @@ test.describe('Analytics Page', () => {
     
     // Ask about session cleanup - this replaces the old diagnostics page functionality
     await page.fill('#questionInput', 'What sessions need cleanup and how many were cleaned up recently?');
-    await page.click('#askButton');
-    
-    await page.waitForTimeout(2000);
+    await submitAndWaitForAnswer(page, () => page.click('#askButton'));
     
     // Verify we get a response about cleanup
     const messages = page.locator('.ai-message');
@@ -287,8 +274,7 @@ test.describe('Analytics Page', () => {
     
     for (let i = 0; i < conversation.length; i++) {
       await page.fill('#questionInput', conversation[i]);
-      await page.click('#askButton');
-      await page.waitForTimeout(2000);
+      await submitAndWaitForAnswer(page, () => page.click('#askButton'));
       
       const messages = page.locator('.ai-message');
       await expect(messages).toHaveCount(i + 1);
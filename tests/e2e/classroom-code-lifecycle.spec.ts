@@ -51,12 +51,7 @@ async function simulateTeacherLogin(page: Page, teacherName: string): Promise<{
   await page.goto(`http://127.0.0.1:5001/teacher?e2e=true&teacherId=${teacherId}&teacherUsername=${teacherName}`);
   await page.waitForLoadState('networkidle', { timeout: testConfig.ui.connectionStatusTimeout });
   
-  // Wait for the WebSocket to update the code from "LIVE" to a real 6-character code
-  await page.waitForSelector('#classroom-code-display', { timeout: testConfig.ui.elementVisibilityTimeout });
-  await page.waitForFunction(() => {
-    const element = document.querySelector('#classroom-code-display');
-    return element && element.textContent && element.textContent !== 'LIVE' && element.textContent.length === 6;
-  }, { timeout: testConfig.ui.connectionStatusTimeout });
+  await waitForClassroomCode(page);
   
   const teacherData = {
     id: teacherId,
@@ -69,6 +64,42 @@ async function simulateTeacherLogin(page: Page, teacherName: string): Promise<{
   };
 }
 
+// Helper function to wait for the WebSocket to update the code from "LIVE" to a real 6-character code
+async function waitForClassroomCode(page: Page): Promise<void> {
+  await page.waitForSelector('#classroom-code-display', { timeout: testConfig.ui.elementVisibilityTimeout });
+  await page.waitForFunction(() => {
+    const element = document.querySelector('#classroom-code-display');
+    return element && element.textContent && element.textContent !== 'LIVE' && element.textContent.length === 6;
+  }, { timeout: testConfig.ui.connectionStatusTimeout });
+}
+
+// Helper function to wait until a student join attempt has a visible outcome
+// (waiting message, error text, or a connection status change). Returns without throwing on timeout
+// so callers can classify whatever state the page ended up in.
+async function waitForStudentJoinOutcome(page: Page): Promise<void> {
+  await page.waitForFunction(() => {
+    const display = document.querySelector('#translation-display')?.textContent || '';
+    const status = document.querySelector('#connection-status')?.textContent || '';
+    return /Waiting for teacher|Error|Invalid classroom code|expired or invalid|Classroom not found/.test(display)
+      || /Connected|No classroom code provided/.test(status);
+  }, undefined, { timeout: testConfig.ui.connectionStatusTimeout }).catch(() => {
+    console.log('Timeout waiting for connection response');
+  });
+}
+
+// Helper function to read every element the join classification needs in one page round trip
+async function readStudentJoinState(page: Page): Promise<{ displayContent: string, statusContent: string, displayVisible: boolean }> {
+  return page.evaluate(() => {
+    const display = document.querySelector('#translation-display');
+    const status = document.querySelector('#connection-status');
+    return {
+      displayContent: display?.textContent || '',
+      statusContent: status?.textContent || '',
+      displayVisible: !!display && display.getClientRects().length > 0 && window.getComputedStyle(display).visibility !== 'hidden'
+    };
+  });
+}
+
 // Helper function to get classroom code from teacher page
 async function getClassroomCodeFromTeacherPage(page: Page): Promise<string> {
   // Don't navigate again - use the current page
@@ -81,8 +112,8 @@ async function simulateStudentJoin(page: Page, classroomCode: string): Promise<{
   await page.goto(`http://127.0.0.1:5001/student?code=${classroomCode}`);
   await page.waitForLoadState('domcontentloaded');
   
-  // Wait for initial page load
-  await page.waitForTimeout(2000);
+  // Wait for the language picker to be ready
+  await page.waitForSelector('#language-dropdown', { timeout: testConfig.ui.elementVisibilityTimeout });
   
   // Select a language then click connect to initiate the WebSocket connection (new UX)
   await page.selectOption('#language-dropdown', { index: 1 });
@@ -101,19 +132,16 @@ async function simulateStudentJoin(page: Page, classroomCode: string): Promise<{
   // Click connect and wait for the response
   await connectButton.click();
   
-  // Wait for WebSocket connection with proper timeout handling
-  try {
-    await page.waitForTimeout(5000); // Increased timeout for slower browsers
-  } catch (error) {
-    console.log('Timeout waiting for connection response');
-  }
+  // Wait for WebSocket connection outcome with proper timeout handling
+  await waitForStudentJoinOutcome(page);
   
-  // Check for the translation display content after connection attempt
-  const translationDisplay = page.locator('#translation-display');
+  // Snapshot the translation display and connection status after the connection attempt
   let displayContent = '';
+  let statusContent = '';
+  let hasTranslationDisplay = false;
   
   try {
-    displayContent = await translationDisplay.textContent() || '';
+    ({ displayContent, statusContent, displayVisible: hasTranslationDisplay } = await readStudentJoinState(page));
   } catch (error) {
     const errorMessage = error instanceof Error ? error.message : String(error);
     console.log('Error reading translation display content:', errorMessage);
@@ -144,9 +172,6 @@ async function simulateStudentJoin(page: Page, classroomCode: string): Promise<{
   }
   
   // Check connection status as secondary indicator
-  const connectionStatus = page.locator('#connection-status');
-  const statusContent = await connectionStatus.textContent() || '';
-  
   // Success cases - Connected status
   if (statusContent && statusContent.includes('Connected')) {
     const studentId = `student-${Date.now()}-${Math.random().toString(36).substr(2, 9)}`;
@@ -159,7 +184,6 @@ async function simulateStudentJoin(page: Page, classroomCode: string): Promise<{
   }
   
   // If we have a translation display visible, check if it shows a proper waiting message
-  const hasTranslationDisplay = await translationDisplay.isVisible();
   if (hasTranslationDisplay) {
     // Only treat as success if there's a proper waiting message
     if (displayContent && displayContent.includes('Waiting for teacher')) {
@@ -180,8 +204,8 @@ async function simulateStudentJoinWithInvalidCode(page: Page, classroomCode: str
   await page.goto(`http://127.0.0.1:5001/student?code=${classroomCode}`);
   await page.waitForLoadState('domcontentloaded');
   
-  // Wait for initial page load
-  await page.waitForTimeout(2000);
+  // Wait for the language picker to be ready
+  await page.waitForSelector('#language-dropdown', { timeout: testConfig.ui.elementVisibilityTimeout });
   
   // Select a language then click connect (new UX)
   await page.selectOption('#language-dropdown', { index: 1 });
@@ -378,7 +402,7 @@ test.describe('Classroom Code Lifecycle E2E Tests', () => {
       // Step 2: Teacher creates session with consistent ID
       await page.goto(`http://127.0.0.1:5001/teacher?e2e=true&teacherId=${teacherId}&teacherUsername=persistence-teacher`);
       await page.waitForLoadState('domcontentloaded');
-      await page.waitForTimeout(3000); // Wait for WebSocket connection
+      await waitForClassroomCode(page); // Wait for WebSocket registration to assign the code
       
       const originalClassroomCode = await getClassroomCodeFromTeacherPage(page);
       
@@ -398,7 +422,7 @@ test.describe('Classroom Code Lifecycle E2E Tests', () => {
       const reconnectedPage = await context.newPage();
       await reconnectedPage.goto(`http://127.0.0.1:5001/teacher?e2e=true&teacherId=${teacherId}&teacherUsername=persistence-teacher`);
       await reconnectedPage.waitForLoadState('domcontentloaded');
-      await reconnectedPage.waitForTimeout(3000); // Wait for WebSocket connection
+      await waitForClassroomCode(reconnectedPage); // Wait for WebSocket registration to restore the code
       
       const reconnectedClassroomCode = await getClassroomCodeFromTeacherPage(reconnectedPage);
       
@@ -607,7 +631,7 @@ test.describe('Classroom Code Lifecycle E2E Tests', () => {
           await studentPage.waitForSelector('#language-dropdown', { timeout: 5000 });
           await studentPage.selectOption('#language-dropdown', { index: 1 });
           await studentPage.click('#connect-btn');
-          await studentPage.waitForTimeout(2000); // Give server time to process and reject
+          await waitForStudentJoinOutcome(studentPage); // Wait for the server to process and reject
         } catch (error) {
           console.log(`Connection handled for invalid code ${invalidCode} (expected behavior)`);
         } finally {
@@ -0,0 +1,63 @@
+/**
+ * Page helpers for E2E tests
+ * Browser-side checks that cover several elements in a single round trip
+ */
+import type { Page } from '@playwright/test';
+import { testConfig } from './test-timeouts.js';
+
+/**
+ * Wait until every selector matches a visible element.
+ * Runs as one browser-side poll instead of one expect() round trip per selector.
+ * Duplicate selectors within one call are checked once; nothing is cached between calls.
+ * On timeout the error lists the selectors that were still missing.
+ */
+export async function expectAllVisible(
+  page: Page,
+  selectors: string[],
+  timeout: number = testConfig.ui.elementVisibilityTimeout
+): Promise<void> {
+  const pending = [...new Set(selectors)];
+  if (pending.length === 0) return;
+
+  try {
+    await page.waitForFunction(
+      (sels: string[]) => sels.every((sel) => {
+        const el = document.querySelector(sel);
+        if (!el) return false;
+        const style = window.getComputedStyle(el);
+        return style.visibility !== 'hidden' && el.getClientRects().length > 0;
+      }),
+      pending,
+      { timeout }
+    );
+  } catch {
+    const missing = await page.evaluate(
+      (sels: string[]) => sels.filter((sel) => {
+        const el = document.querySelector(sel);
+        return !el || el.getClientRects().length === 0 || window.getComputedStyle(el).visibility === 'hidden';
+      }),
+      pending
+    ).catch(() => pending);
+    throw new Error(`Elements not visible after ${timeout}ms: ${missing.join(', ')}`);
+  }
+}
+
+/**
+ * Poll a Node-side probe until it returns a value (anything but null/undefined/false) or the budget runs out.
+ * The probe receives the remaining budget so it can cap its own request timeouts.
+ * Returns null on timeout. The interval is shared via testConfig.wait.pollInterval (TEST_POLL_INTERVAL_MS).
+ */
+export async function pollUntil<T>(
+  page: Page,
+  probe: (remainingMs: number) => Promise<T | null | undefined | false>,
+  timeoutMs: number,
+  intervalMs: number = testConfig.wait.pollInterval
+): Promise<T | null> {
+  const deadline = Date.now() + timeoutMs;
+  while (Date.now() < deadline) {
+    const result = await probe(Math.max(deadline - Date.now(), 1));
+    if (result !== null && result !== undefined && result !== false) return result;
+    await page.waitForTimeout(Math.min(intervalMs, Math.max(deadline - Date.now(), 0)));
+  }
+  return null;
+}
@@ -24,6 +24,8 @@ interface TestConfig {
     shortWait: number;
     standardWait: number;
     adjustableWait: number;
+    // Delay between attempts in condition-polling loops (pollUntil)
+    pollInterval: number;
   };
   mock: {
     // Mock timing values
@@ -137,6 +139,8 @@ export const testConfig: TestConfig = {
       getEnvNumber('TEST_ADJUSTABLE_WAIT_MS', 1500),
       1000
     ),
+    // Not scaled: the 500ms scaling floor would make polling coarser, not faster
+    pollInterval: getEnvNumber('TEST_POLL_INTERVAL_MS', 100),
   },
   mock: {
     audioDataDelay: scaleForTest(
@@ -11,23 +11,29 @@
 
 import { test, expect } from '@playwright/test';
 import { testConfig } from './helpers/test-timeouts';
+import { pollUntil } from './helpers/page-helpers';
 import { getTeacherURL, getStudentURL, getAnalyticsURL } from './helpers/test-config';
 import { seedRealisticTestData, clearDiagnosticData } from './test-data-utils';
 
 // Deterministic analytics helpers (avoid NL parsing flakiness)
-async function isSessionActiveByClassCode(page: any, classroomCode: string): Promise<boolean> {
-  const resp = await page.request.get('/api/analytics/active-sessions');
-  if (!resp.ok()) return false;
-  const json = await resp.json();
+// requestTimeoutMs caps each API call so a stalled request can't outlast the caller's own polling budget.
+// Returns null when the state is unknown (timeout, refused, non-2xx, bad JSON) so a broken endpoint never reads as "inactive".
+async function isSessionActiveByClassCode(page: any, classroomCode: string, requestTimeoutMs?: number): Promise<boolean | null> {
+  const resp = await page.request.get('/api/analytics/active-sessions', { timeout: requestTimeoutMs }).catch(() => null);
+  if (!resp || !resp.ok()) return null;
+  const json = await resp.json().catch(() => null);
+  if (!json) return null;
   const classCodes: string[] = json?.data?.classCodes || [];
   return classCodes.includes(classroomCode);
 }
 
 // Deterministic summaries (prefer over natural-language analytics)
-async function getActiveSessionsSummary(page: any): Promise<{ activeSessions: Array<{ sessionId: string, classCode: string | null }>}> {
+// requestTimeoutMs is the budget for the whole lookup: the fallback request only gets what the first one left over
+async function getActiveSessionsSummary(page: any, requestTimeoutMs?: number): Promise<{ activeSessions: Array<{ sessionId: string, classCode: string | null }>}> {
+  const deadline = requestTimeoutMs === undefined ? undefined : Date.now() + requestTimeoutMs;
   // Try direct sessions endpoint first
   try {
-    const res = await page.request.get('/api/sessions/active');
+    const res = await page.request.get('/api/sessions/active', { timeout: requestTimeoutMs });
     const json = await res.json();
     if (json && json.data && Array.isArray(json.data.activeSessions)) {
       return json.data;
@@ -35,9 +41,11 @@ async function getActiveSessionsSummary(page: any): Promise<{ activeSessions: Ar
   } catch (_) {
     // fall through to analytics fallback
   }
-  // Fallback to analytics endpoint and normalize
+  // Fallback to analytics endpoint and normalize. Playwright treats timeout 0 as "no timeout", so skip it once the budget is spent
+  const remainingMs = deadline === undefined ? undefined : deadline - Date.now();
+  if (remainingMs !== undefined && remainingMs <= 0) return { activeSessions: [] };
   try {
-    const res2 = await page.request.get('/api/analytics/active-sessions');
+    const res2 = await page.request.get('/api/analytics/active-sessions', { timeout: remainingMs });
     const j2 = await res2.json();
     const data = j2?.data || {};
     const sessionIds: string[] = data.sessionIds || [];
@@ -49,31 +57,29 @@ async function getActiveSessionsSummary(page: any): Promise<{ activeSessions: Ar
   }
 }
 
-async function getSessionIdByClassCode(page: any, classroomCode: string): Promise<string | null> {
+async function getSessionIdByClassCode(page: any, classroomCode: string, requestTimeoutMs?: number): Promise<string | null> {
   const normalizedCode = (classroomCode || '').trim();
-  const data = await getActiveSessionsSummary(page);
+  const data = await getActiveSessionsSummary(page, requestTimeoutMs);
   const match = (data.activeSessions || []).find((s: any) => (s.classCode || '').trim() === normalizedCode);
   return match ? match.sessionId : null;
 }
 
 async function waitForSessionIdByClassCode(page: any, classroomCode: string, timeoutMs = 8000): Promise<string | null> {
-  const start = Date.now();
-  while (Date.now() - start < timeoutMs) {
-    const sid = await getSessionIdByClassCode(page, classroomCode);
-    if (sid) return sid;
-    await page.waitForTimeout(200);
-  }
-  return null;
+  // Bound each request by the remaining budget; the request context's 30s default would otherwise dominate
+  return pollUntil(page, (remainingMs) => getSessionIdByClassCode(page, classroomCode, remainingMs), timeoutMs);
 }
 
 async function waitForClassCodeActiveState(page: any, classroomCode: string, expectedActive: boolean, timeoutMs = 8000): Promise<boolean> {
-  const start = Date.now();
-  while (Date.now() - start < timeoutMs) {
-    const isActive = await isSessionActiveByClassCode(page, classroomCode);
-    if (isActive === expectedActive) return true;
-    await page.waitForTimeout(250);
-  }
-  return false;
+  const reached = await pollUntil(
+    page,
+    async (remainingMs) => {
+      const isActive = await isSessionActiveByClassCode(page, classroomCode, remainingMs);
+      // Unknown state (null) never counts as a match; keep polling
+      return isActive !== null && isActive === expectedActive;
+    },
+    timeoutMs
+  );
+  return reached === true;
 }
 
 // Helper function to navigate to analytics page
@@ -182,8 +188,7 @@ async function getClassroomCodeFromTeacherPage(page: any): Promise<string> {
     return (classroomCode || '').trim();
   } catch {
     // Deterministic fallback: poll active sessions API for a short window
-    const deadline = Date.now() + testConfig.ui.classroomCodeTimeout;
-    while (Date.now() < deadline) {
+    const fallbackCode = await pollUntil(page, async () => {
       // UI-based fallback: parse student URL text if present
       try {
         const studentUrlText = await page.locator('#studentUrl').textContent({ timeout: 500 }).catch(() => null);
@@ -200,13 +205,14 @@ async function getClassroomCodeFromTeacherPage(page: any): Promise<string> {
           const json = await res.json();
           const sessions = json?.data?.activeSessions || [];
           const first = sessions.find((s: any) => s.classCode && /^[A-Z0-9]{6}$/.test((s.classCode || '').trim()));
-          if (first) return first.classCode.trim();
+          if (first) return first.classCode.trim() as string;
         } catch (_) {
           // ignore parse errors and retry
         }
       }
-      await page.waitForTimeout(300);
-    }
+      return null;
+    }, testConfig.ui.classroomCodeTimeout);
+    if (fallbackCode) return fallbackCode;
     throw new Error('Failed to obtain classroom code from UI and API fallback');
   }
 }
@@ -2,7 +2,6 @@
 import { test, expect } from '@playwright/test';
 import { getAnalyticsURL } from './helpers/test-config';
 import { seedRealisticTestData, clearDiagnosticData } from './test-data-utils';
-import { ensureTestDatabaseSchema } from './test-setup';
 
 /**
  * Session Lifecycle E2E Tests
@@ -35,8 +34,8 @@ async function navigateToAnalytics(page: any): Promise<void> {
 }
 
 test.describe('Session Lifecycle E2E Tests', () => {
+  // Schema is migrated once in test-config/global-setup.ts; per test we only reset the data
   test.beforeEach(async ({ page }) => {
-    await ensureTestDatabaseSchema();
     await clearDiagnosticData();
     await seedRealisticTestData();
   });
@@ -45,8 +45,7 @@ test.describe('Student Two-Way Communication - PTT and Send', () => {
     // Send button enables with text
     await expect(student.locator('#ask-send')).toBeDisabled();
     await student.fill('#ask-input', 'Hello teacher');
-    // allow input listener to run
-    await student.waitForTimeout(300);
+    // toBeEnabled retries until the input listener has run
     await expect(student.locator('#ask-send')).toBeEnabled();
   });
 });
@@ -27,19 +27,20 @@ test('Teacher can use Manual mode: record, review text, and Send Last Audio', as
   const reviewText = page.locator('#manualText');
   await expect(reviewText).toBeVisible();
 
-  // Simulate a recorded segment arriving (populate lastSegmentBlob)
-  await page.evaluate(() => {
+  // Simulate a recorded segment arriving (populate lastSegmentBlob); test data goes in as an argument
+  const segment = { language: 'en-US', sessionId: 'TESTSESSION', reviewText: 'Test sentence from last audio.' };
+  await page.evaluate(({ language, sessionId, reviewText }) => {
     const sample = new Blob([new Uint8Array([1,2,3,4,5])], { type: 'audio/webm' });
     (window as any).appState = (window as any).appState || {};
     (window as any).appState.lastSegmentBlob = sample;
-    (window as any).appState.selectedLanguage = 'en-US';
-    (window as any).appState.sessionId = 'TESTSESSION';
+    (window as any).appState.selectedLanguage = language;
+    (window as any).appState.sessionId = sessionId;
     // Also populate review text for clarity
     const ta = document.getElementById('manualText') as HTMLTextAreaElement | null;
-    if (ta) ta.value = 'Test sentence from last audio.';
+    if (ta) ta.value = reviewText;
     // Mock open WebSocket
     (window as any).appState.ws = { readyState: 1, send: (msg: string) => { (window as any).__sentMsg = msg; } };
-  });
+  }, segment);
 
   // Click Send Last Audio and assert a message was sent with manual flag
   await page.click('#manualSendBtn');
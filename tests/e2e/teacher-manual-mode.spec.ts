@@ -19,8 +19,9 @@ test('Manual mode shows controls and enables Send Last Audio after recording sto
   await page.waitForSelector('#manualControls', { state: 'visible', timeout: Math.max(testConfig.ui.elementVisibilityTimeout, 7000) });
   await expect(page.locator('#manualSendBtn')).toBeDisabled();
 
-  // Inject a last segment and ensure button enables
-  await page.evaluate(() => {
+  // Inject a last segment and ensure button enables; test data goes in as an argument
+  const segment = { language: 'en-US', sessionId: 'E2ESESSION' };
+  await page.evaluate(({ language, sessionId }) => {
     const blob = new Blob([new Uint8Array([1,2,3])], { type: 'audio/webm' });
     (window as any).appState = (window as any).appState || {};
     (window as any).appState.lastSegmentBlob = blob;
@@ -33,9 +34,9 @@ test('Manual mode shows controls and enables Send Last Audio after recording sto
       });
     }
     (window as any).appState.ws = { readyState: 1, send: (msg: string) => { (window as any).__lastSent = msg; } };
-    (window as any).appState.selectedLanguage = 'en-US';
-    (window as any).appState.sessionId = 'E2ESESSION';
-  });
+    (window as any).appState.selectedLanguage = language;
+    (window as any).appState.sessionId = sessionId;
+  }, segment);
 
   await page.click('#manualSendBtn');
   const last = await page.evaluate(() => (window as any).__lastSent || null);
@@ -8,220 +8,256 @@
  * - Classroom code generation
  * - Teacher-student interaction flows
  */
-import { test, expect, Browser, Page, BrowserContext } from '@playwright/test';
+import { test, expect, Browser, Page, BrowserContext, Locator } from '@playwright/test';
 import { getTeacherURL, getStudentURL } from './helpers/test-config.js';
 import { testConfig } from './helpers/test-timeouts.js';
+import { expectAllVisible } from './helpers/page-helpers.js';
 
-test.describe('Teacher Interface - Comprehensive Test Suite', () => {
-  let page: Page;
-
-  test.beforeEach(async ({ browser, browserName }) => {
-    // Create a new context with permissions (only for Chromium)
-    const contextOptions: any = {};
-    if (browserName === 'chromium') {
-      contextOptions.permissions = ['microphone'];
-    }
-    const context = await browser.newContext(contextOptions);
-    page = await context.newPage();
-    page.on('console', msg => {
-      // Surface browser logs into test output for debugging
-      // eslint-disable-next-line no-console
-      console.log(`[browser:${msg.type()}]`, msg.text());
-    });
+/**
+ * Install the audio/speech mocks and open the teacher page (E2E mode)
+ */
+async function openTeacherPage(page: Page): Promise<void> {
+  page.on('console', msg => {
+    // Surface browser logs into test output for debugging
+    // eslint-disable-next-line no-console
+    console.log(`[browser:${msg.type()}]`, msg.text());
+  });
+  
+  // Mock getUserMedia and Speech Recognition for audio tests
+  const audioDataDelayInMs = testConfig.mock.audioDataDelay;
+  await page.addInitScript((delay) => {
+    // Create a mock MediaStream
+    const mockStream = {
+      getTracks: () => [{
+        kind: 'audio',
+        stop: () => {},
+        enabled: true
+      }],
+      getAudioTracks: () => [{
+        kind: 'audio',
+        stop: () => {},
+        enabled: true
+      }],
+      active: true
+    };
     
-    // Mock getUserMedia and Speech Recognition for audio tests
-    const audioDataDelayInMs = testConfig.mock.audioDataDelay;
-    await page.addInitScript((delay) => {
-      // Create a mock MediaStream
-      const mockStream = {
-        getTracks: () => [{
-          kind: 'audio',
-          stop: () => {},
-          enabled: true
-        }],
-        getAudioTracks: () => [{
-          kind: 'audio',
-          stop: () => {},
-          enabled: true
-        }],
-        active: true
-      };
+    // Mock MediaRecorder
+    (window as any).MediaRecorder = class MockMediaRecorder {
+      state = 'inactive';
+      ondataavailable: ((event: any) => void) | null = null;
+      onstop: (() => void) | null = null;
+      
+      constructor(stream: any, options: any) {
+        console.log('MockMediaRecorder created with options:', options);
+      }
       
-      // Mock MediaRecorder
-      (window as any).MediaRecorder = class MockMediaRecorder {
-        state = 'inactive';
-        ondataavailable: ((event: any) => void) | null = null;
-        onstop: (() => void) | null = null;
+      start(timeslice?: number) {
+        console.log('MockMediaRecorder started with timeslice:', timeslice);
+        this.state = 'recording';
         
-        constructor(stream: any, options: any) {
-          console.log('MockMediaRecorder created with options:', options);
-        }
-        
-        start(timeslice?: number) {
-          console.log('MockMediaRecorder started with timeslice:', timeslice);
-          this.state = 'recording';
-          
-          // Simulate data available events
-          if (this.ondataavailable) {
-            setTimeout(() => {
-              const mockBlob = new Blob(['mock audio data'], { type: 'audio/webm' });
-              if (this.ondataavailable) {
-                this.ondataavailable({ data: mockBlob });
-              }
-            }, delay as number);
-          }
-        }
-        
-        stop() {
-          console.log('MockMediaRecorder stopped');
-          this.state = 'inactive';
-          if (this.onstop) {
-            this.onstop();
-          }
-        }
-        
-        static isTypeSupported(mimeType: string) {
-          return mimeType === 'audio/webm' || mimeType === 'audio/ogg';
+        // Simulate data available events
+        if (this.ondataavailable) {
+          setTimeout(() => {
+            const mockBlob = new Blob(['mock audio data'], { type: 'audio/webm' });
+            if (this.ondataavailable) {
+              this.ondataavailable({ data: mockBlob });
+            }
+          }, delay as number);
         }
-      };
+      }
       
-      // Mock getUserMedia
-      Object.defineProperty(navigator, 'mediaDevices', {
-        writable: true,
-        value: {
-          getUserMedia: async (constraints: any) => {
-            console.log('getUserMedia called with constraints:', constraints);
-            return mockStream as any;
-          }
+      stop() {
+        console.log('MockMediaRecorder stopped');
+        this.state = 'inactive';
+        if (this.onstop) {
+          this.onstop();
         }
-      });
+      }
       
-      // Mock Speech Recognition
-      (window as any).webkitSpeechRecognition = class MockSpeechRecognition {
-        continuous = false;
-        interimResults = false;
-        lang = 'en-US';
-        onresult: ((event: any) => void) | null = null;
-        onerror: ((event: any) => void) | null = null;
-        onend: (() => void) | null = null;
-        
-        start() {
-          console.log('Speech recognition started');
-          // Simulate a transcription result after a delay
-          setTimeout(() => {
-            if (this.onresult) {
-              this.onresult({
-                resultIndex: 0,
-                results: [{
-                  isFinal: true,
-                  0: { transcript: 'Hello, this is a test transcription' }
-                }]
-              });
-            }
-          }, 500);
+      static isTypeSupported(mimeType: string) {
+        return mimeType === 'audio/webm' || mimeType === 'audio/ogg';
+      }
+    };
+    
+    // Mock getUserMedia
+    Object.defineProperty(navigator, 'mediaDevices', {
+      writable: true,
+      value: {
+        getUserMedia: async (constraints: any) => {
+          console.log('getUserMedia called with constraints:', constraints);
+          return mockStream as any;
         }
-        
-        stop() {
-          console.log('Speech recognition stopped');
-          if (this.onend) {
-            this.onend();
+      }
+    });
+    
+    // Mock Speech Recognition
+    (window as any).webkitSpeechRecognition = class MockSpeechRecognition {
+      continuous = false;
+      interimResults = false;
+      lang = 'en-US';
+      onresult: ((event: any) => void) | null = null;
+      onerror: ((event: any) => void) | null = null;
+      onend: (() => void) | null = null;
+      
+      start() {
+        console.log('Speech recognition started');
+        // Simulate a transcription result after a delay
+        setTimeout(() => {
+          if (this.onresult) {
+            this.onresult({
+              resultIndex: 0,
+              results: [{
+                isFinal: true,
+                0: { transcript: 'Hello, this is a test transcription' }
+              }]
+            });
           }
+        }, 500);
+      }
+      
+      stop() {
+        console.log('Speech recognition stopped');
+        if (this.onend) {
+          this.onend();
         }
-      };
-    }, audioDataDelayInMs);
-    
-    // Navigate to teacher page with E2E test flag (use explicit .html for dev/E2E reliability)
-    await page.goto(getTeacherURL('e2e=true').replace('/teacher', '/teacher.html'));
-    await page.waitForLoadState('domcontentloaded');
+      }
+    };
+  }, audioDataDelayInMs);
+  
+  // Navigate to teacher page with E2E test flag (use explicit .html for dev/E2E reliability)
+  await page.goto(getTeacherURL('e2e=true').replace('/teacher', '/teacher.html'));
+  await page.waitForLoadState('domcontentloaded');
+}
+
+// Basic UI Tests
+// These tests only read the page, so they share a single teacher page instead of reloading it per test
+test.describe('Teacher Interface - Basic UI and Connection', () => {
+  test.describe.configure({ mode: 'serial' });
+
+  let context: BrowserContext;
+  let page: Page;
+  let status: Locator;
+  let recordButton: Locator;
+
+  test.beforeAll(async ({ browser, browserName }) => {
+    context = await browser.newContext(browserName === 'chromium' ? { permissions: ['microphone'] } : {});
+    page = await context.newPage();
+    status = page.locator('#status');
+    recordButton = page.locator('#recordButton');
+    await openTeacherPage(page);
   });
 
-  test.afterEach(async () => {
-    if (page) {
-      await page.close();
-    }
+  test.afterAll(async () => {
+    await context?.close();
   });
 
-  // Basic UI Tests
-  test.describe('Basic UI and Connection', () => {
   test('should default to German language on page load', async () => {
     // Wait for the language dropdown to be visible
-    await expect(page.locator('#teacherLanguage')).toBeVisible();
+    const languageSelect = page.locator('#teacherLanguage');
+    await expect(languageSelect).toBeVisible();
     
     // Check that German (de-DE) is selected by default
-    const selectedValue = await page.locator('#teacherLanguage').inputValue();
+    const selectedValue = await languageSelect.inputValue();
     expect(selectedValue).toBe('de-DE');
     
     // Also check the displayed text
-    const selectedText = await page.locator('#teacherLanguage option:checked').textContent();
+    const selectedText = await languageSelect.locator('option:checked').textContent();
     expect(selectedText).toContain('German');
   });
 
   test('should display initial UI elements correctly', async () => {
-    // Check h1 (main heading)
-    const mainHeading = page.locator('h1');
-    await expect(mainHeading).toBeVisible();
-    await expect(mainHeading).toContainText('Teacher Interface');
-
-    // Check other essential UI elements
-    await expect(page.locator('#teacherLanguage')).toBeVisible();
+    // Check h1 (main heading) and other essential UI elements in one poll
+    await expectAllVisible(page, ['h1', '#teacherLanguage', '#recordButton', '#transcription']);
+    await expect(page.locator('h1')).toContainText('Teacher Interface');
     
-    const recordButton = page.locator('#recordButton');
-    await expect(recordButton).toBeVisible();
     await expect(recordButton).toBeEnabled(); 
     await expect(recordButton).toHaveText('Start Recording'); 
-    
-    await expect(page.locator('#transcription')).toBeVisible(); 
   });
 
   test('should establish WebSocket connection automatically', async () => {
     // Wait for auto-connection status message
-      await expect(page.locator('#status')).toContainText('Registered as teacher', { timeout: testConfig.ui.teacherRegistrationTimeout });
-    });
+    await expect(status).toContainText('Registered as teacher', { timeout: testConfig.ui.teacherRegistrationTimeout });
+  });
 
-    test('should display classroom code and QR code', async () => {
-      // Wait for WebSocket connection and registration
-      await expect(page.locator('#status')).toContainText('Registered as teacher', { timeout: testConfig.ui.teacherRegistrationTimeout });
-      
-      // Check classroom code is displayed and becomes a 6-char code (not placeholder)
-      const classroomCode = page.locator('#classroom-code-display');
-      await expect(classroomCode).toBeVisible({ timeout: testConfig.ui.classroomCodeTimeout });
-      await expect(classroomCode).not.toHaveText('LIVE', { timeout: testConfig.ui.classroomCodeTimeout });
-      const codeText = (await classroomCode.textContent()) || '';
-      expect(codeText).toMatch(/^[A-Z0-9]{6}$/);
-      
-      // Student URL should be displayed
-      const studentUrl = page.locator('#studentUrl');
-      await expect(studentUrl).toContainText(`/student?code=${codeText}`);
-      
-      // QR code container should exist and have a canvas
-      const qrCodeContainer = page.locator('#qr-code');
-      await expect(qrCodeContainer).toBeVisible();
-      
-      // Check that QR code canvas exists (it might be inside the container)
-      const qrCanvas = qrCodeContainer.locator('canvas');
-      const canvasCount = await qrCanvas.count();
-      expect(canvasCount).toBeGreaterThan(0);
-    });
+  test('should display classroom code and QR code', async () => {
+    // Wait for WebSocket connection and registration
+    await expect(status).toContainText('Registered as teacher', { timeout: testConfig.ui.teacherRegistrationTimeout });
+    
+    // Check classroom code is displayed and becomes a 6-char code (not placeholder)
+    const classroomCode = page.locator('#classroom-code-display');
+    await expect(classroomCode).toBeVisible({ timeout: testConfig.ui.classroomCodeTimeout });
+    await expect(classroomCode).not.toHaveText('LIVE', { timeout: testConfig.ui.classroomCodeTimeout });
+    const codeText = (await classroomCode.textContent()) || '';
+    expect(codeText).toMatch(/^[A-Z0-9]{6}$/);
+    
+    // Student URL should be displayed
+    const studentUrl = page.locator('#studentUrl');
+    await expect(studentUrl).toContainText(`/student?code=${codeText}`);
+    
+    // QR code container should exist and have a canvas
+    const qrCodeContainer = page.locator('#qr-code');
+    await expect(qrCodeContainer).toBeVisible();
+    
+    // Check that QR code canvas exists (it might be inside the container)
+    const qrCanvas = qrCodeContainer.locator('canvas');
+    const canvasCount = await qrCanvas.count();
+    expect(canvasCount).toBeGreaterThan(0);
+  });
+});
+
+test.describe('Teacher Interface - Comprehensive Test Suite', () => {
+  let page: Page;
+  // Locators for elements nearly every test touches; resolved lazily, so one instance per page is enough
+  let status: Locator;
+  let recordButton: Locator;
+
+  test.beforeEach(async ({ page: fixturePage, context, browserName }) => {
+    // Use the per-test fixture context (Playwright closes it after each test); grant permissions only for Chromium
+    if (browserName === 'chromium') {
+      await context.grantPermissions(['microphone']);
+    }
+    page = fixturePage;
+    status = page.locator('#status');
+    recordButton = page.locator('#recordButton');
+    await openTeacherPage(page);
   });
 
   // Language Selection Tests
   test.describe('Language Selection', () => {
   test('should handle language selection', async () => {
     // Wait for connection first, as language change might trigger re-registration
-    await expect(page.locator('#status')).toContainText('Registered as teacher', { timeout: testConfig.ui.teacherRegistrationTimeout });
+    await expect(status).toContainText('Registered as teacher', { timeout: testConfig.ui.teacherRegistrationTimeout });
+    
+    // Capture outgoing messages on the already-open socket (send is looked up on the prototype)
+    await page.evaluate(() => {
+      (window as any).__wsMessages = [];
+      const originalSend = WebSocket.prototype.send;
+      WebSocket.prototype.send = function(data: any) {
+        try {
+          (window as any).__wsMessages.push(JSON.parse(data));
+        } catch (e) {
+          // Not JSON, ignore
+        }
+        return originalSend.call(this, data);
+      };
+    });
     
     // Change language
     await page.selectOption('#teacherLanguage', 'es-ES'); // Spanish (Spain)
-    const selectedValue = await page.locator('#teacherLanguage').inputValue();
-    expect(selectedValue).toBe('es-ES');
+    await expect(page.locator('#teacherLanguage')).toHaveValue('es-ES');
     
-    // The application should ideally re-register with the new language.
-    await page.waitForTimeout(testConfig.wait.standardWait); 
+    // The application re-registers with the new language; wait for that message to actually go out.
+    await page.waitForFunction(
+      () => ((window as any).__wsMessages || []).some((msg: any) => msg.type === 'register' && msg.languageCode === 'es-ES'),
+      undefined,
+      { timeout: testConfig.ui.teacherRegistrationTimeout }
+    );
+    await expect(status).toContainText('Registered as teacher');
   });
 
     test('should handle language changes during recording', async () => {
       // Wait for WebSocket connection
-      await expect(page.locator('#status')).toContainText('Registered as teacher', { timeout: testConfig.ui.teacherRegistrationTimeout });
+      await expect(status).toContainText('Registered as teacher', { timeout: testConfig.ui.teacherRegistrationTimeout });
       
       // Change language
       const languageSelect = page.locator('#teacherLanguage');
@@ -242,11 +278,7 @@ test.describe('Teacher Interface - Comprehensive Test Suite', () => {
         });
       });
       
-      // Wait a bit for the registration to be sent
-      await page.waitForTimeout(testConfig.wait.shortWait);
-      
       // Start recording to verify language is used
-      const recordButton = page.locator('#recordButton');
       await recordButton.click();
       
       // Verify recording started
@@ -258,10 +290,9 @@ test.describe('Teacher Interface - Comprehensive Test Suite', () => {
   test.describe('Audio Recording and Transcription', () => {
   test('should handle recording controls', async () => {
     // Wait for WebSocket connection to be established first
-    await expect(page.locator('#status')).toContainText('Registered as teacher', { timeout: testConfig.ui.teacherRegistrationTimeout });
+    await expect(status).toContainText('Registered as teacher', { timeout: testConfig.ui.teacherRegistrationTimeout });
 
     // Check initial state of the record button
-    const recordButton = page.locator('#recordButton');
     await expect(recordButton).toBeEnabled();
     await expect(recordButton).toHaveText('Start Recording');
     
@@ -270,37 +301,33 @@ test.describe('Teacher Interface - Comprehensive Test Suite', () => {
       
       // Wait for recording to start
       await expect(recordButton).toHaveText('Stop Recording');
-      await expect(page.locator('#status')).toContainText('Recording...');
+      await expect(status).toContainText('Recording...');
       
       // Stop recording
       await recordButton.click();
       await expect(recordButton).toHaveText('Start Recording');
-      await expect(page.locator('#status')).toContainText('Recording stopped');
+      await expect(status).toContainText('Recording stopped');
     });
 
     test('should display transcriptions from speech recognition', async () => {
       // Wait for WebSocket connection
-      await expect(page.locator('#status')).toContainText('Registered as teacher', { timeout: testConfig.ui.teacherRegistrationTimeout });
+      await expect(status).toContainText('Registered as teacher', { timeout: testConfig.ui.teacherRegistrationTimeout });
       
       // Start recording
-      const recordButton = page.locator('#recordButton');
       await recordButton.click();
       
       // Wait for recording to start
       await expect(recordButton).toHaveText('Stop Recording');
-      await expect(page.locator('#status')).toContainText('Recording...');
+      await expect(status).toContainText('Recording...');
       
-      // Wait for transcription to appear (mock speech recognition sends it after 500ms)
-      await page.waitForTimeout(testConfig.wait.standardWait);
-      
-      // Check that transcription is displayed
+      // Check that transcription is displayed (mock speech recognition sends it after 500ms)
       const transcriptionDisplay = page.locator('#transcription');
-      await expect(transcriptionDisplay).toContainText('Hello, this is a test transcription');
+      await expect(transcriptionDisplay).toContainText('Hello, this is a test transcription', { timeout: testConfig.ui.elementVisibilityTimeout });
       
       // Stop recording
       await recordButton.click();
       await expect(recordButton).toHaveText('Start Recording');
-      await expect(page.locator('#status')).toContainText('Recording stopped');
+      await expect(status).toContainText('Recording stopped');
     });
 
     test('should send transcriptions through WebSocket', async () => {
@@ -327,14 +354,17 @@ test.describe('Teacher Interface - Comprehensive Test Suite', () => {
       await page.waitForLoadState('domcontentloaded');
       
       // Wait for WebSocket connection and authentication bypass
-      await expect(page.locator('#status')).toContainText('Registered as teacher', { timeout: testConfig.ui.teacherRegistrationTimeout });
+      await expect(status).toContainText('Registered as teacher', { timeout: testConfig.ui.teacherRegistrationTimeout });
       
       // Start recording
-      const recordButton = page.locator('#recordButton');
       await recordButton.click();
       
       // Wait for transcription to be sent (mock sends after 500ms)
-      await page.waitForTimeout(testConfig.wait.adjustableWait);
+      await page.waitForFunction(
+        () => ((window as any).__wsMessages || []).some((msg: any) => msg.type === 'transcription'),
+        undefined,
+        { timeout: testConfig.ui.elementVisibilityTimeout }
+      );
       
       // Get WebSocket messages
       const messages = await page.evaluate(() => (window as any).__wsMessages || []);
@@ -356,7 +386,7 @@ test.describe('Teacher Interface - Comprehensive Test Suite', () => {
 
     test('should send audio data through WebSocket', async () => {
       // Wait for WebSocket connection
-      await expect(page.locator('#status')).toContainText('Registered as teacher', { timeout: testConfig.ui.teacherRegistrationTimeout });
+      await expect(status).toContainText('Registered as teacher', { timeout: testConfig.ui.teacherRegistrationTimeout });
       
       // Intercept WebSocket messages
       const wsMessages: any[] = [];
@@ -377,14 +407,17 @@ test.describe('Teacher Interface - Comprehensive Test Suite', () => {
       // Reload to apply WebSocket interception
       await page.reload();
       await page.waitForLoadState('domcontentloaded');
-      await expect(page.locator('#status')).toContainText('Registered as teacher', { timeout: testConfig.ui.teacherRegistrationTimeout });
+      await expect(status).toContainText('Registered as teacher', { timeout: testConfig.ui.teacherRegistrationTimeout });
       
       // Start recording
-      const recordButton = page.locator('#recordButton');
       await recordButton.click();
       
       // Wait for audio to be sent (MediaRecorder sends data after 150ms in our mock)
-      await page.waitForTimeout(testConfig.wait.shortWait);
+      await page.waitForFunction(
+        () => ((window as any).__wsMessages || []).some((msg: any) => msg.type === 'audio'),
+        undefined,
+        { timeout: testConfig.ui.elementVisibilityTimeout }
+      );
       
       // Get WebSocket messages
       const messages = await page.evaluate(() => (window as any).__wsMessages || []);
@@ -543,11 +576,8 @@ test.describe('Teacher Interface - Comprehensive Test Suite', () => {
       const recordButton = errorPage.locator('#recordButton');
       await recordButton.click();
       
-      // Wait for error to be processed
-      await errorPage.waitForTimeout(testConfig.wait.shortWait);
-      
-      // Check error is displayed
-      await expect(errorPage.locator('#status')).toContainText('Speech recognition error: network');
+      // Check error is displayed once the mock fires it
+      await expect(errorPage.locator('#status')).toContainText('Speech recognition error: network', { timeout: testConfig.ui.elementVisibilityTimeout });
       
       // Clean up
       await errorPage.close();
@@ -563,7 +593,7 @@ test.describe('Teacher Interface - Comprehensive Test Suite', () => {
       
       try {
         // Wait for teacher to be ready
-        await expect(page.locator('#status')).toContainText('Registered as teacher', { timeout: testConfig.ui.teacherRegistrationTimeout });
+        await expect(status).toContainText('Registered as teacher', { timeout: testConfig.ui.teacherRegistrationTimeout });
         const classroomCodeElement = page.locator('#classroom-code-display');
         await expect(classroomCodeElement).toBeVisible({ timeout: testConfig.ui.classroomCodeTimeout });
         const classroomCode = await classroomCodeElement.textContent();
@@ -582,10 +612,10 @@ test.describe('Teacher Interface - Comprehensive Test Suite', () => {
         await expect(studentPage.locator('#connection-status')).toContainText('Connected', { timeout: testConfig.ui.connectionStatusTimeout });
         
         // Verify teacher is still ready (status might change if student connection triggers UI update)
-        await expect(page.locator('#recordButton')).toBeEnabled();
+        await expect(recordButton).toBeEnabled();
         // Consider if teacher status should be re-checked or if it might change upon student connection
         // For now, let's assume it remains 'Registered as teacher' or similar non-error state.
-        await expect(page.locator('#status')).toContainText('Registered as teacher'); 
+        await expect(status).toContainText('Registered as teacher'); 
 
       } finally {
         await studentPage.close();
@@ -598,7 +628,7 @@ test.describe('Teacher Interface - Comprehensive Test Suite', () => {
       const studentPage = await studentContext.newPage();
       
       try {
-        await expect(page.locator('#status')).toContainText('Registered as teacher', { timeout: testConfig.ui.teacherRegistrationTimeout });
+        await expect(status).toContainText('Registered as teacher', { timeout: testConfig.ui.teacherRegistrationTimeout });
         const classroomCodeElement = page.locator('#classroom-code-display');
         const classroomCode = await classroomCodeElement.textContent();
         expect(classroomCode).toBeTruthy();
@@ -613,12 +643,8 @@ test.describe('Teacher Interface - Comprehensive Test Suite', () => {
         
         // Student changes language (e.g., to German)
         await studentPage.selectOption('#language-dropdown', 'de-DE');
-        // Add a short wait if the language change triggers async operations like re-registering
-        await studentPage.waitForTimeout(testConfig.wait.standardWait); // Adjust as needed
-        
         // Verify student language change was processed
-        const selectedLang = await studentPage.locator('#language-dropdown').inputValue();
-        expect(selectedLang).toBe('de-DE');
+        await expect(studentPage.locator('#language-dropdown')).toHaveValue('de-DE');
 
         // If the UI temporarily shows disconnected after language change, re-connect explicitly
         const statusText = await studentPage.locator('#connection-status').innerText();
@@ -640,7 +666,7 @@ test.describe('Teacher Interface - Comprehensive Test Suite', () => {
       const studentPage = await studentContext.newPage();
       
       try {
-        await expect(page.locator('#status')).toContainText('Registered as teacher', { timeout: testConfig.ui.teacherRegistrationTimeout });
+        await expect(status).toContainText('Registered as teacher', { timeout: testConfig.ui.teacherRegistrationTimeout });
         const classroomCodeElement = page.locator('#classroom-code-display');
         const classroomCode = await classroomCodeElement.textContent();
         expect(classroomCode).toBeTruthy();
@@ -684,7 +710,7 @@ test.describe('Teacher Interface - Comprehensive Test Suite', () => {
           }
         }
         
-        await expect(page.locator('#status')).toContainText('Registered as teacher');
+        await expect(status).toContainText('Registered as teacher');
       } finally {
         await studentPage.close();
         await studentContext.close();
@@ -693,7 +719,7 @@ test.describe('Teacher Interface - Comprehensive Test Suite', () => {
 
     test('should transmit teacher\'s speech to student as translated text and enable audio playback', async ({ browser }) => {
       // 1. Teacher Setup
-      await expect(page.locator('#status')).toContainText('Registered as teacher', { timeout: testConfig.ui.teacherRegistrationTimeout });
+      await expect(status).toContainText('Registered as teacher', { timeout: testConfig.ui.teacherRegistrationTimeout });
       const classroomCodeElement = page.locator('#classroom-code-display');
       await expect(classroomCodeElement).toBeVisible();
       await expect(classroomCodeElement).not.toHaveText('LIVE', { timeout: testConfig.ui.classroomCodeTimeout });
@@ -709,9 +735,6 @@ test.describe('Teacher Interface - Comprehensive Test Suite', () => {
       const studentContext = await browser.newContext();
       const studentPage = await studentContext.newPage();
       
-      // Small delay to ensure teacher session is stable before student connects
-      await page.waitForTimeout(testConfig.wait.shortWait);
-      
       try {
         await studentPage.goto(`${getStudentURL(classroomCode)}&wsparam=code`);
         await studentPage.waitForLoadState('domcontentloaded');
@@ -727,9 +750,8 @@ test.describe('Teacher Interface - Comprehensive Test Suite', () => {
         await expect(studentPage.locator('#translation-display')).toContainText('Waiting for teacher to start speaking...');
 
         // 3. Teacher Action
-        const recordButton = page.locator('#recordButton');
         await recordButton.click(); // Start recording
-        await expect(page.locator('#status')).toContainText('Recording...');
+        await expect(status).toContainText('Recording...');
 
         const teacherTranscription = 'Hello, this is a test transcription';
         // Wait for teacher's UI to show the mock transcription
@@ -747,7 +769,7 @@ test.describe('Teacher Interface - Comprehensive Test Suite', () => {
 
         // Stop recording
         await recordButton.click(); 
-        await expect(page.locator('#status')).toContainText('Recording stopped');
+        await expect(status).toContainText('Recording stopped');
 
         // Check if Play Audio button is enabled (assuming server sends TTS audio)
         const playButton = studentPage.locator('#play-button');
@@ -1,5 +1,14 @@
 // Cypress E2E test for teacher-student flow
 
+// Full-page HTML dumps are only for debugging; enable with CYPRESS_DEBUG=1
+function logPageHtml(label) {
+  if (!Cypress.env('DEBUG')) return;
+  cy.document().then(doc => {
+    // eslint-disable-next-line no-console
+    console.log(`${label}:`, doc.documentElement.outerHTML);
+  });
+}
+
 describe('Teacher-Student Session Flow', () => {
   let studentUrl;
   let classroomCode;
@@ -16,11 +25,7 @@ describe('Teacher-Student Session Flow', () => {
 
   it('Teacher page loads and shows classroom code', () => {
     cy.visit('/teacher?e2e=true');
-    cy.document().then(doc => {
-      // Log the teacher page HTML for inspection
-      // eslint-disable-next-line no-console
-      console.log('TEACHER PAGE HTML:', doc.documentElement.outerHTML);
-    });
+    logPageHtml('TEACHER PAGE HTML');
     cy.get('#classroom-code-display').should('not.have.text', 'LIVE');
     cy.get('#studentUrl').should('not.contain', 'Waiting for connection...');
   });
@@ -31,11 +36,7 @@ describe('Teacher-Student Session Flow', () => {
         win.VITE_WS_URL = 'ws://localhost:5000';
       }
     });
-    cy.document().then(doc => {
-      // Log the student page HTML for inspection
-      // eslint-disable-next-line no-console
-      console.log('STUDENT PAGE HTML:', doc.documentElement.outerHTML);
-    });
+    logPageHtml('STUDENT PAGE HTML');
     cy.get('#language-dropdown').should('exist');
     cy.get('#connect-btn').should('exist');
     cy.get('#connection-status').should('exist');
@@ -50,18 +51,10 @@ describe('Teacher-Student Session Flow', () => {
     cy.get('#language-dropdown').select('en-US');
     cy.get('#connect-btn').click();
     cy.get('#connection-status').should('contain.text', 'Connected');
-    cy.document().then(doc => {
-      // Log the student page HTML after connecting
-      // eslint-disable-next-line no-console
-      console.log('STUDENT PAGE HTML AFTER CONNECT:', doc.documentElement.outerHTML);
-    });
+    logPageHtml('STUDENT PAGE HTML AFTER CONNECT');
     cy.visit('/teacher?e2e=true');
     cy.get('#recordButton').click();
-    cy.document().then(doc => {
-      // Log the teacher page HTML after starting recording
-      // eslint-disable-next-line no-console
-      console.log('TEACHER PAGE HTML AFTER RECORD:', doc.documentElement.outerHTML);
-    });
+    logPageHtml('TEACHER PAGE HTML AFTER RECORD');
   });
 
   it('Teacher creates a session and receives a classroom code', () => {
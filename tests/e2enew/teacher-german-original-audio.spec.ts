@@ -9,8 +9,10 @@ test.describe('German original audio playback (server-provided)', () => {
     test.setTimeout(120000);
     const base = process.env.E2E_BASE_URL || 'http://localhost:3000';
 
+    // A unique teacherId gives this spec its own session and classroom code when specs run in parallel
+    const teacherId = `teacher-german-audio-${Date.now()}`;
     const teacher = await context.newPage();
-    await teacher.goto(`${base}/teacher?twoWay=0&e2e=true`);
+    await teacher.goto(`${base}/teacher?twoWay=0&e2e=true&teacherId=${teacherId}`);
     await teacher.waitForSelector('#classroom-code-display');
     const code = (await teacher.locator('#classroom-code-display').textContent())?.trim();
     expect(code && code.length).toBeTruthy();
@@ -19,7 +21,7 @@ test.describe('German original audio playback (server-provided)', () => {
     await student.goto(`${base}/student?code=${code}`);
     await student.selectOption('#language-dropdown', 'en-US');
     await student.click('#connect-btn');
-    await student.getByText('Waiting for teacher').waitFor({ timeout: 15000 });
+    await expect(student.locator('#translation-display')).toContainText('Waiting for teacher', { timeout: 15000 });
 
     // Simulate teacher sending a German message through UI shortcut if present, otherwise rely on server demo controls
     // Minimal approach: wait until Play Original is enabled (server should include original audio once a message is sent)
@@ -28,11 +30,25 @@ test.describe('German original audio playback (server-provided)', () => {
     await playOriginal.waitFor({ state: 'attached' });
     await expect(playOriginal).toBeDisabled();
 
-    // Give server some time to send a message (demo pipelines may auto-send or a cron may trigger). In real E2E we would trigger a send.
-    await student.waitForTimeout(5000);
+    // Give server up to 5s to send a message (demo pipelines may auto-send or a cron may trigger). In real E2E we would trigger a send.
+    // A MutationObserver on the button resolves the moment it is enabled instead of always sleeping the full window.
+    const becameEnabled = await student.evaluate((windowMs: number) => new Promise<boolean>((resolve) => {
+      const button = document.querySelector('#play-original-button') as HTMLButtonElement | null;
+      if (!button) return resolve(false);
+      if (!button.disabled) return resolve(true);
+      const observer = new MutationObserver(() => {
+        if (!button.disabled) {
+          observer.disconnect();
+          clearTimeout(timer);
+          resolve(true);
+        }
+      });
+      observer.observe(button, { attributes: true, attributeFilter: ['disabled'] });
+      const timer = setTimeout(() => { observer.disconnect(); resolve(false); }, windowMs);
+    }), 5000);
 
     // If it becomes enabled, click it once. Test passes if no error dialog appears.
-    if (await playOriginal.isEnabled()) {
+    if (becameEnabled) {
       await playOriginal.click();
       await student.waitForTimeout(500);
     }
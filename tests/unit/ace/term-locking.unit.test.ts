@@ -12,7 +12,19 @@ describe('TermLockingService', () => {
     expect(out).toContain('fotosíntesis');
     expect(out).toContain('base de datos');
   });
-});
-
 
+  it('prefers the longest matching term and leaves other languages untouched', () => {
+    const svc = new TermLockingService({
+      cell: { de: 'Zelle' },
+      'cell wall': { de: 'Zellwand' }
+    });
+    expect(svc.applyLockedTerms('The Cell wall protects the cell.', 'de')).toBe('The Zellwand protects the Zelle.');
+    expect(svc.applyLockedTerms('The cell wall protects the cell.', 'fr')).toBe('The cell wall protects the cell.');
+  });
 
+  it('matches terms whose lowercase form differs from the original spelling', () => {
+    // 'KİMYA'.toLowerCase() inserts a combining dot ('ki̇mya'), which would no longer match the text
+    const svc = new TermLockingService({ KİMYA: { en: 'chemistry' } });
+    expect(svc.applyLockedTerms('Today KİMYA starts.', 'en')).toBe('Today chemistry starts.');
+  });
+});
@@ -0,0 +1,61 @@
+import { describe, it, expect, beforeEach, vi } from 'vitest';
+import { TranslationPipelineService } from '../../../../server/services/pipeline/TranslationPipelineService';
+
+// Mock logger
+vi.mock('../../../../server/logger', () => ({
+  default: {
+    error: vi.fn(),
+    warn: vi.fn(),
+    debug: vi.fn(),
+    info: vi.fn()
+  }
+}));
+
+describe('TranslationPipelineService', () => {
+  let translate: ReturnType<typeof vi.fn>;
+  let service: TranslationPipelineService;
+
+  beforeEach(() => {
+    vi.clearAllMocks();
+    translate = vi.fn();
+    service = new TranslationPipelineService(
+      { transcribe: vi.fn() } as any,
+      { translate } as any,
+      () => ({ synthesize: vi.fn() }) as any
+    );
+  });
+
+  describe('translateAll', () => {
+    it('should start all target language translations without waiting for each other', async () => {
+      const resolvers: Array<() => void> = [];
+      translate.mockImplementation((text: string, _source: string, target: string) =>
+        new Promise<string>((resolve) => resolvers.push(() => resolve(`${text} [${target}]`)))
+      );
+
+      const pending = service.translateAll('Hello', 'en-US', ['es-ES', 'fr-FR', 'de-DE']);
+      await Promise.resolve();
+
+      expect(translate).toHaveBeenCalledTimes(3);
+      resolvers.reverse().forEach((resolve) => resolve());
+
+      const result = await pending;
+      expect(Array.from(result.entries())).toEqual([
+        ['es-ES', 'Hello [es-ES]'],
+        ['fr-FR', 'Hello [fr-FR]'],
+        ['de-DE', 'Hello [de-DE]']
+      ]);
+    });
+
+    it('should fall back to the original text for a failed language only', async () => {
+      translate.mockImplementation(async (text: string, _source: string, target: string) => {
+        if (target === 'fr-FR') throw new Error('provider down');
+        return `${text} [${target}]`;
+      });
+
+      const result = await service.translateAll('Hello', 'en-US', ['es-ES', 'fr-FR']);
+
+      expect(result.get('es-ES')).toBe('Hello [es-ES]');
+      expect(result.get('fr-FR')).toBe('Hello');
+    });
+  });
+});
@@ -57,6 +57,49 @@ describe('TranscriptionBusinessService (Original Source Audio included)', () =>
     expect(typeof msg.originalAudioData).toBe('string');
     expect(msg.originalAudioFormat).toBeDefined();
   });
-});
 
+  it('starts per-language translation without waiting for the original-language TTS', async () => {
+    const fakeBuffer = Buffer.from('test-audio');
+    let releaseOriginal!: () => void;
+    const originalGate = new Promise<void>((resolve) => { releaseOriginal = resolve; });
+    const synthesizeSpeech = vi.fn(async (_text: string, lang: string) => {
+      // Hold the teacher-language synthesis until translation has been dispatched
+      if (lang === 'en-US') await originalGate;
+      return { audioBuffer: fakeBuffer, ttsServiceType: 'elevenlabs' };
+    });
+    const translateText = vi.fn(async () => {
+      releaseOriginal();
+      return 'translated-text';
+    });
+    const speechPipelineOrchestrator: any = { synthesizeSpeech, translateText };
+    const storage: any = { addTranslation: vi.fn() };
+
+    const { TranscriptionBusinessService } = await import(
+      '../../../../server/services/transcription/TranscriptionBusinessService'
+    );
+    const service = new TranscriptionBusinessService(storage, speechPipelineOrchestrator);
+
+    const sent: any[] = [];
+    const studentWs: any = { readyState: 1, send: (msg: string) => sent.push(JSON.parse(msg)) };
+
+    // Would never settle if translation waited for the gated original synthesis
+    await (service as any).processTranslationsForStudents({
+      text: 'hello teacher',
+      teacherLanguage: 'en-US',
+      sessionId: 'sess',
+      studentConnections: [studentWs],
+      studentLanguages: ['es-ES'],
+      startTime: Date.now(),
+      latencyTracking: { start: Date.now(), components: {} },
+      clientProvider: {
+        getClientSettings: () => ({}),
+        getLanguage: () => 'es-ES',
+        getSessionId: () => 'sess',
+      },
+    });
 
+    expect(translateText).toHaveBeenCalledTimes(1);
+    const msg = sent.find((m) => m?.type === 'translation');
+    expect(msg?.originalAudioData).toBe(fakeBuffer.toString('base64'));
+  });
+});
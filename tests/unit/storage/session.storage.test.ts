@@ -1052,6 +1052,21 @@ describe('Session Storage', () => {
       });
     });
 
+    it('should find a session by sessionId after the shared map is changed externally', async () => {
+      const created = await sessionStorage.createSession({ sessionId: 'moved', teacherId: 'teacher-moved' });
+      expect((await sessionStorage.getSessionById('moved'))?.id).toBe(created.id);
+
+      // Another storage re-keys the session in the shared map
+      sessionsMap.delete(created.id);
+      sessionsMap.set(42, { ...created, id: 42 });
+
+      expect((await sessionStorage.getSessionById('moved'))?.id).toBe(42);
+      expect((await sessionStorage.updateSession('moved', { studentsCount: 3 }))?.studentsCount).toBe(3);
+
+      sessionsMap.delete(42);
+      expect(await sessionStorage.getSessionById('moved')).toBeUndefined();
+    });
+
     it('should handle empty session stats', async () => {
       const stats = await sessionStorage.getSessionQualityStats();
 